@@ -0,0 +1,152 @@
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from typing import Dict, List, Optional
+
+PRIORITIES = {"interactive": 0, "background": 1}
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, model_key: str, reason: str, retry_after: int):
+        super().__init__(f"{reason} (model={model_key})")
+        self.model_key = model_key
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+class AdmissionTicket:
+    def __init__(self, controller: "AdmissionController", model_key: str):
+        self.controller = controller
+        self.model_key = model_key
+        self.admitted_at = time.monotonic()
+        self._attached = False
+        self._released = False
+
+    def attach(self, future):
+        """Hold the slot until ``future`` completes instead of until ``release()``."""
+        self._attached = True
+        future.add_done_callback(lambda _: self._finish())
+
+    def release(self):
+        if not self._attached:
+            self._finish()
+
+    def _finish(self):
+        if not self._released:
+            self._released = True
+            self.controller._release(self)
+
+
+class AdmissionController:
+    """Bounded, priority-ordered admission in front of the summarization executor.
+
+    At most ``max_concurrent`` requests run at once. The rest wait in a per-model queue of
+    at most ``queue_depth`` entries, of which background requests may only fill
+    ``background_share``. Waiters are admitted interactive first, then in arrival order.
+    A request that cannot be queued, or whose deadline cannot be met by the estimated wait,
+    is rejected straight away with a retry hint. All methods run on the event loop thread.
+    """
+
+    def __init__(self, max_concurrent: int, queue_depth: int, model_queue_depths: Optional[Dict[str, int]] = None,
+                 background_share: float = 0.5):
+        self.max_concurrent = max(1, max_concurrent)
+        self.queue_depth = max(0, queue_depth)
+        self.model_queue_depths = dict(model_queue_depths or {})
+        self.background_share = min(1.0, max(0.0, background_share))
+        self._running = 0
+        self._heap: List[list] = []
+        self._waiting: Dict[str, int] = {}
+        self._seq = itertools.count()
+        self._service_seconds: Optional[float] = None
+        self._stats = {"admitted": 0, "queued": 0, "rejected": 0, "expired": 0, "abandoned": 0}
+
+    def depth_for(self, model_key: str, priority: str = "interactive") -> int:
+        depth = self.model_queue_depths.get(model_key, self.queue_depth)
+        if PRIORITIES.get(priority, 0) > 0:
+            depth = int(depth * self.background_share)
+        return depth
+
+    def waiting(self) -> int:
+        return sum(self._waiting.values())
+
+    def estimated_wait(self) -> float:
+        waiting = self.waiting()
+        if self._running + waiting < self.max_concurrent:
+            return 0.0
+        service = self._service_seconds if self._service_seconds is not None else 1.0
+        return (waiting + 1) * service / self.max_concurrent
+
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.estimated_wait()))
+
+    async def acquire(self, model_key: str, priority: str = "interactive", deadline: Optional[float] = None) -> AdmissionTicket:
+        self._dispatch()
+        if self._running < self.max_concurrent:
+            return self._admit(model_key)
+
+        if self._waiting.get(model_key, 0) >= self.depth_for(model_key, priority):
+            self._stats["rejected"] += 1
+            raise AdmissionRejected(model_key, "Queue full", self.retry_after())
+        if deadline is not None and self._service_seconds is not None and time.monotonic() + self.estimated_wait() > deadline:
+            self._stats["rejected"] += 1
+            raise AdmissionRejected(model_key, "Deadline cannot be met", self.retry_after())
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, [PRIORITIES.get(priority, 0), next(self._seq), future, model_key])
+        self._waiting[model_key] = self._waiting.get(model_key, 0) + 1
+        self._stats["queued"] += 1
+        try:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, _ = await asyncio.wait({future}, timeout=timeout)
+            if not done:
+                future.cancel()
+                self._stats["expired"] += 1
+                raise DeadlineExceeded(f"Deadline passed while queued (model={model_key})")
+            return future.result()
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                future.result().release()
+            else:
+                future.cancel()
+            self._stats["abandoned"] += 1
+            raise
+        finally:
+            self._waiting[model_key] -= 1
+
+    def _admit(self, model_key: str) -> AdmissionTicket:
+        self._running += 1
+        self._stats["admitted"] += 1
+        return AdmissionTicket(self, model_key)
+
+    def _release(self, ticket: AdmissionTicket):
+        self._running -= 1
+        elapsed = time.monotonic() - ticket.admitted_at
+        if self._service_seconds is None:
+            self._service_seconds = elapsed
+        else:
+            self._service_seconds = 0.8 * self._service_seconds + 0.2 * elapsed
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._heap and (self._running < self.max_concurrent or self._heap[0][2].done()):
+            _, _, future, model_key = heapq.heappop(self._heap)
+            if not future.done():
+                future.set_result(self._admit(model_key))
+
+    def stats(self) -> dict:
+        return {
+            **self._stats,
+            "running": self._running,
+            "max_concurrent": self.max_concurrent,
+            "waiting": {model_key: count for model_key, count in self._waiting.items() if count},
+            "queue_depth": self.queue_depth,
+            "model_queue_depths": self.model_queue_depths,
+            "avg_service_seconds": round(self._service_seconds, 3) if self._service_seconds is not None else None,
+            "retry_after_seconds": self.retry_after(),
+        }
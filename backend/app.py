@@ -1,16 +1,55 @@
 import asyncio
+import bisect
+import codecs
+import functools
+import hashlib
+import json
 import logging
 import re
-import unicodedata
+import threading
+import time
 import warnings
-from concurrent.futures import ThreadPoolExecutor
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.requests import ClientDisconnect
 from pydantic import BaseModel
-from transformers import pipeline
+
+import metrics
+import settings
+from admission import PRIORITIES, AdmissionController, AdmissionRejected, AdmissionTicket, DeadlineExceeded
+from batching import BatchScheduler
+from boilerplate import BoilerplateFilter, FingerprintStore, site_of
+from cache import SummaryCache, content_key
+from compression import DecompressionMiddleware, supported_encodings
+from decoding import AUTO_TIER, DECODING_TIERS, TierSelector, apply_tier
+from extractive import select_sentences
+from hierarchical import LeafSplitter, TreeReducer
+from inference_pool import InferencePool
+from jobs import JobRunner, JobStore
+from models import (
+    MODEL_ALIASES,
+    MODEL_PREFIXES,
+    MODEL_PROFILES,
+    MODEL_SPECS,
+    ModelInput,
+    build_pipeline,
+    build_tokenizer,
+    max_input_tokens,
+    model_backend,
+    resolve_model_key,
+    run_batch,
+)
+from preprocess import Document, StreamNormalizer, normalize_text, preprocess_text
+from router import ModelRouter
+from shared_weights import memory_report
 
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=UserWarning)
@@ -18,16 +57,117 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 summarizers = {}
-executor = ThreadPoolExecutor(max_workers=4)
+tokenizers = {}
+executor = ThreadPoolExecutor(max_workers=settings.MAX_CONCURRENT_REQUESTS)
+admission: Optional[AdmissionController] = None
+job_store: Optional[JobStore] = None
+tier_selector: Optional[TierSelector] = None
+model_router: Optional[ModelRouter] = None
+boilerplate_filter: Optional[BoilerplateFilter] = None
+job_runner: Optional[JobRunner] = None
+batch_scheduler: Optional[BatchScheduler] = None
+inference_pool: Optional[InferencePool] = None
+summary_cache: Optional[SummaryCache] = None
+chunk_cache: Optional[SummaryCache] = None
+model_loader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="model-loader")
+model_futures: Dict[str, Future] = {}
+model_states: Dict[str, dict] = {}
+model_load_lock = threading.Lock()
+pool_start_lock = threading.Lock()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await load_models()
+    global admission, tier_selector, model_router, boilerplate_filter, batch_scheduler, inference_pool, summary_cache, chunk_cache, job_store, job_runner
+    admission = AdmissionController(
+        max_concurrent=settings.MAX_CONCURRENT_REQUESTS,
+        queue_depth=settings.QUEUE_DEPTH,
+        model_queue_depths=settings.MODEL_QUEUE_DEPTHS,
+        background_share=settings.BACKGROUND_QUEUE_SHARE
+    )
+    tier_selector = TierSelector(
+        slo_ms=settings.LATENCY_SLO_MS,
+        window_seconds=settings.LATENCY_WINDOW_SECONDS,
+        balanced_queue=settings.AUTO_TIER_BALANCED_QUEUE,
+        fast_queue=settings.AUTO_TIER_FAST_QUEUE
+    )
+    if settings.CACHE_ENABLED:
+        summary_cache = SummaryCache(
+            max_memory_bytes=settings.CACHE_MEMORY_BYTES,
+            db_path=settings.CACHE_DB_PATH,
+            ttl_seconds=settings.CACHE_TTL_SECONDS,
+            max_disk_entries=settings.CACHE_MAX_DISK_ENTRIES
+        )
+    if settings.CHUNK_CACHE_ENABLED:
+        chunk_cache = SummaryCache(
+            max_memory_bytes=settings.CHUNK_CACHE_MEMORY_BYTES,
+            db_path=settings.CHUNK_CACHE_DB_PATH,
+            ttl_seconds=settings.CACHE_TTL_SECONDS,
+            max_disk_entries=settings.CHUNK_CACHE_MAX_DISK_ENTRIES
+        )
+    if settings.BOILERPLATE_ENABLED:
+        boilerplate_filter = BoilerplateFilter(
+            FingerprintStore(settings.FINGERPRINT_DB_PATH, max_entries=settings.FINGERPRINT_MAX_ENTRIES),
+            similarity=settings.NEAR_DUPLICATE_SIMILARITY,
+            site_repeat_threshold=settings.SITE_REPEAT_THRESHOLD
+        )
+    if settings.ROUTER_ENABLED:
+        model_router = ModelRouter.from_settings(
+            settings.ROUTER_MODELS,
+            MODEL_PROFILES,
+            settings.ROUTER_PROFILES_PATH,
+            slo_ms=settings.LATENCY_SLO_MS,
+            relax_queue=settings.ROUTER_RELAX_QUEUE
+        )
+    if settings.INFERENCE_BACKEND == "process_pool":
+        inference_pool = InferencePool(
+            served_models(),
+            num_workers=settings.POOL_WORKERS,
+            cores_per_worker=settings.POOL_CORES_PER_WORKER
+        )
+    if settings.BATCHING_ENABLED:
+        batch_scheduler = BatchScheduler(
+            run_generation_batch,
+            max_batch_size=settings.BATCH_MAX_SIZE,
+            max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+            workers=max(settings.BATCH_WORKERS, inference_pool.size if inference_pool else 1)
+        )
+        batch_scheduler.start()
+    preload_models()
+    if settings.JOBS_ENABLED:
+        job_store = JobStore(settings.JOBS_DB_PATH)
+        purged = job_store.purge_finished(settings.JOBS_RETENTION_SECONDS)
+        if purged:
+            logger.info(f"Purged {purged} finished jobs past retention")
+        job_runner = JobRunner(job_store, summarize_job_document, concurrency=settings.JOBS_CONCURRENCY)
+        job_runner.start()
     yield
+    if job_runner is not None:
+        await job_runner.shutdown()
+        job_runner = None
+    if job_store is not None:
+        job_store.close()
+        job_store = None
+    model_loader.shutdown(wait=False, cancel_futures=True)
     executor.shutdown(wait=True)
+    if batch_scheduler is not None:
+        batch_scheduler.shutdown()
+        batch_scheduler = None
+    if inference_pool is not None:
+        inference_pool.shutdown()
+        inference_pool = None
+    if summary_cache is not None:
+        summary_cache.close()
+        summary_cache = None
+    if chunk_cache is not None:
+        chunk_cache.close()
+        chunk_cache = None
+    if boilerplate_filter is not None:
+        boilerplate_filter.store.close()
+        boilerplate_filter = None
 
 app = FastAPI(title="ContentSnap API", version="2.2.0", lifespan=lifespan)
 
+app.add_middleware(DecompressionMiddleware, max_bytes=settings.DECOMPRESSED_MAX_BYTES)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -42,6 +182,21 @@ class SummarizeRequest(BaseModel):
     max_length: Optional[int] = None  
     min_length: Optional[int] = None
     detail_level: str = "medium" 
+    use_cache: bool = True
+    priority: str = "interactive"
+    deadline_ms: Optional[int] = None
+    quality_tier: str = AUTO_TIER
+    source_url: Optional[str] = None
+    time_budget_ms: Optional[int] = None
+
+class SummarizeLookup(BaseModel):
+    content_hash: str
+    format: str = "bullet_points"
+    max_length: Optional[int] = None
+    min_length: Optional[int] = None
+    detail_level: str = "medium"
+    quality_tier: str = AUTO_TIER
+    source_url: Optional[str] = None
 
 class SummarizeResponse(BaseModel):
     summary: str
@@ -50,74 +205,96 @@ class SummarizeResponse(BaseModel):
     summary_length: int
     chunks_processed: int
     detail_level: str
+    cached: bool = False
+    chunks_reused: int = 0
+    chunks_generated: int = 0
+    prefiltered_length: Optional[int] = None
+    quality_tier: Optional[str] = None
+    preprocessing: Optional[dict] = None
+    levels: Optional[List[dict]] = None
+    chunk_modes: Optional[List[str]] = None
+    budget_exhausted: Optional[bool] = None
+
+def _start_inference_pool():
+    with pool_start_lock:
+        if not inference_pool.running:
+            inference_pool.start()
+            logger.info(f"Process pool serving models: {inference_pool.loaded_models()}")
 
-async def load_models():
+def load_model(model_key: str):
+    model_name = MODEL_SPECS[model_key]
+    started = time.perf_counter()
+    model_states[model_key] = {"state": "loading", "backend": model_backend(model_key)}
+    logger.info(f"Loading {model_name} model...")
     try:
-        logger.info("Loading summarization models...")
-        
-        try:
-            summarizers["bart"] = pipeline(
-                "summarization",
-                model="facebook/bart-large-cnn",
-                tokenizer="facebook/bart-large-cnn",
-                device=-1,
-                clean_up_tokenization_spaces=True
-            )
-            logger.info("BART-large model loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load BART model: {e}")
-        
-        try:
-            summarizers["t5"] = pipeline(
-                "summarization",
-                model="t5-base",
-                tokenizer="t5-base",
-                device=-1,
-                clean_up_tokenization_spaces=True
-            )
-            logger.info("T5 model loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load T5 model: {e}")
-        
-        if "bart" in summarizers:
-            summarizers["pegasus"] = summarizers["bart"]
-            logger.info("Using BART for long text processing")
+        if inference_pool is not None:
+            _start_inference_pool()
+            if model_key not in inference_pool.loaded_models():
+                raise RuntimeError(f"Inference workers could not load {model_name}")
+            summarizer = inference_pool.pipeline(model_key)
+            try:
+                tokenizers[model_key] = build_tokenizer(model_key)
+            except Exception as e:
+                logger.error(f"Failed to load {model_key} tokenizer, falling back to character chunking: {e}")
+        else:
+            summarizer = build_pipeline(model_key)
+            tokenizers[model_key] = summarizer.tokenizer
         
-        if "bart" in summarizers:
-            summarizers["long_text"] = summarizers["bart"]
-            logger.info("Long text model configured")
+        summarizers[model_key] = summarizer
+        for alias, target in MODEL_ALIASES.items():
+            if target == model_key:
+                summarizers[alias] = summarizer
+                if model_key in tokenizers:
+                    tokenizers[alias] = tokenizers[model_key]
+                logger.info(f"Using {target} for {alias} processing")
         
-        if not summarizers:
-            raise Exception("No models could be loaded")
-            
-        logger.info(f"Models loaded successfully! Available models: {list(summarizers.keys())}")
+        load_time = time.perf_counter() - started
+        model_states[model_key].update(state="ready", load_time_s=round(load_time, 2))
+        logger.info(f"{model_name} model loaded successfully ({model_backend(model_key)} backend) in {load_time:.1f}s")
     except Exception as e:
-        logger.error(f"Critical error loading models: {e}")
+        model_states[model_key].update(state="failed", error=str(e), load_time_s=round(time.perf_counter() - started, 2))
+        logger.error(f"Failed to load {model_name} model: {e}")
         raise
 
+def ensure_model_loaded(model_key: str) -> Future:
+    model_key = resolve_model_key(model_key)
+    if model_key not in MODEL_SPECS:
+        raise KeyError(f"Unknown model: {model_key}")
+    with model_load_lock:
+        future = model_futures.get(model_key)
+        if future is None or (future.done() and future.exception() is not None):
+            model_states[model_key] = {"state": "queued", "backend": model_backend(model_key)}
+            future = model_loader.submit(load_model, model_key)
+            model_futures[model_key] = future
+    return future
+
+async def wait_for_model(model_key: str):
+    try:
+        await asyncio.wrap_future(ensure_model_loaded(model_key))
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Model '{model_key}' is not available: {e}"
+        )
+
+def preload_models():
+    for model_key in settings.PRELOAD_MODELS:
+        if resolve_model_key(model_key) in MODEL_SPECS:
+            ensure_model_loaded(model_key)
+        else:
+            logger.warning(f"Ignoring unknown preload model: {model_key}")
+
+def readiness() -> dict:
+    preload = {resolve_model_key(k) for k in settings.PRELOAD_MODELS if resolve_model_key(k) in MODEL_SPECS}
+    states = {model_key: model_states.get(model_key, {"state": "not_loaded"}) for model_key in MODEL_SPECS}
+    ready = all(states[k]["state"] == "ready" for k in preload)
+    return {"ready": ready, "preload": sorted(preload), "models": states}
+
 def clean_text(text: str) -> str:
-    text = unicodedata.normalize('NFKD', text)
-    
-    char_replacements = {
-        '"': '"', '"': '"',
-        ''': "'", ''': "'",
-        '–': '-', '—': '-',
-        '…': '...',
-        '★': '*',
-        '🎬': '[Movie]',
-        '💖': '[Heart]',
-    }
-    
-    for old_char, new_char in char_replacements.items():
-        text = text.replace(old_char, new_char)
-    
-    text = re.sub(r'[^\w\s.,!?;:\-()"\'\[\]*/]', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    
-    return text
+    return normalize_text(text)
 
-def intelligent_chunk_text(text: str, target_chunks: int = 0) -> List[str]:
+def intelligent_chunk_text(document: Document, target_chunks: int = 0) -> List[str]:
+    text = document.text
     text_length = len(text)
     
     if target_chunks == 0:
@@ -139,12 +316,11 @@ def intelligent_chunk_text(text: str, target_chunks: int = 0) -> List[str]:
     
     sections = []
     
-    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+    paragraphs = [p for p in document.paragraphs() if p]
     if len(paragraphs) >= target_chunks // 2:
         sections = paragraphs
     else:
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+        sentences = [s.strip() for s in document.sentences() if len(s.strip()) > 20]
         
         if len(sentences) >= target_chunks:
             sentences_per_chunk = max(2, len(sentences) // target_chunks)
@@ -182,6 +358,114 @@ def intelligent_chunk_text(text: str, target_chunks: int = 0) -> List[str]:
     logger.info(f"Final chunking result: {len(final_chunks)} chunks, sizes: {[len(c) for c in final_chunks]}")
     return final_chunks
 
+CHUNK_SIZE_BUCKETS = (600, 900, 1350, 2000, 3000, 4500, 6750, 10000)
+
+def _is_chunk_boundary(sentence: str, chunk_size: int) -> bool:
+    return zlib.crc32(sentence.encode("utf-8")) % max(2, chunk_size // 240) == 0
+
+def stable_chunk_text(document: Document, target_chunk_size: int) -> List[str]:
+    chunk_size = max([b for b in CHUNK_SIZE_BUCKETS if b <= target_chunk_size] or [CHUNK_SIZE_BUCKETS[0]])
+    min_size = chunk_size // 2
+    max_size = chunk_size * 2
+    
+    sentences = []
+    for sentence in document.sentences():
+        sentence = sentence.strip()
+        while len(sentence) > max_size:
+            cut = sentence.rfind(" ", 0, max_size)
+            cut = cut if cut > 0 else max_size
+            sentences.append(sentence[:cut])
+            sentence = sentence[cut:].strip()
+        if sentence:
+            sentences.append(sentence)
+    
+    chunks = []
+    current = []
+    current_length = 0
+    
+    for sentence in sentences:
+        current.append(sentence)
+        current_length += len(sentence) + 1
+        if current_length >= max_size or (current_length >= min_size and _is_chunk_boundary(sentence, chunk_size)):
+            chunks.append(" ".join(current))
+            current = []
+            current_length = 0
+    
+    if current:
+        tail = " ".join(current)
+        if chunks and len(tail) <= 100:
+            chunks[-1] = chunks[-1] + " " + tail
+        else:
+            chunks.append(tail)
+    
+    logger.info(f"Stable chunking: chunk_size={chunk_size}, {len(chunks)} chunks, sizes: {[len(c) for c in chunks]}")
+    return chunks
+
+TOKEN_CHUNK_BUCKETS = (128, 192, 256, 384, 512, 768, 1024)
+FALLBACK_SUMMARY_CHARS = 600
+
+def token_chunk_text(document: Document, model_key: str, target_chunks: int):
+    text = document.text
+    tokenizer = tokenizers[model_key]
+    encoding = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True, verbose=False)
+    ids = encoding["input_ids"]
+    offsets = encoding["offset_mapping"]
+    if not ids:
+        return [], []
+    
+    prefix = MODEL_PREFIXES.get(resolve_model_key(model_key), "")
+    prefix_ids = tokenizer(prefix, add_special_tokens=False)["input_ids"] if prefix else []
+    budget = max_input_tokens(resolve_model_key(model_key), tokenizer) - tokenizer.num_special_tokens_to_add(pair=False) - len(prefix_ids)
+    overlap = budget // 8
+    body_max = budget - overlap
+    wanted = max(TOKEN_CHUNK_BUCKETS[0], len(ids) // max(1, target_chunks))
+    body_target = min(body_max, max([b for b in TOKEN_CHUNK_BUCKETS if b <= wanted] or [TOKEN_CHUNK_BUCKETS[0]]))
+    body_min = body_target // 2
+    
+    token_starts = [start for start, _ in offsets]
+    sentence_starts = [0]
+    for sentence_start in document.sentence_starts[1:]:
+        index = bisect.bisect_left(token_starts, sentence_start)
+        if sentence_starts[-1] < index < len(ids):
+            sentence_starts.append(index)
+    
+    segments = []
+    for start, end in zip(sentence_starts, sentence_starts[1:] + [len(ids)]):
+        for piece_start in range(start, end, body_max):
+            segments.append((piece_start, min(end, piece_start + body_max)))
+    
+    def is_boundary(start: int, end: int) -> bool:
+        sentence = text[offsets[start][0]:offsets[end - 1][1]]
+        return zlib.crc32(sentence.encode("utf-8")) % max(2, body_target // 30) == 0
+    
+    bodies = []
+    body_start = segments[0][0]
+    for start, end in segments:
+        if end - body_start > body_max:
+            bodies.append((body_start, start))
+            body_start = start
+        if end - body_start >= body_min and is_boundary(start, end):
+            bodies.append((body_start, end))
+            body_start = end
+    if body_start < len(ids):
+        if bodies and len(ids) - body_start < 25 and len(ids) - bodies[-1][0] <= body_max:
+            bodies[-1] = (bodies[-1][0], len(ids))
+        else:
+            bodies.append((body_start, len(ids)))
+    
+    chunks = []
+    chunk_inputs = []
+    for i, (start, end) in enumerate(bodies):
+        if i > 0:
+            window_start = max(bodies[i - 1][0], start - overlap)
+            snap = bisect.bisect_left(sentence_starts, window_start)
+            start = sentence_starts[snap] if snap < len(sentence_starts) and sentence_starts[snap] < start else window_start
+        chunks.append(text[offsets[start][0]:offsets[end - 1][1]].strip())
+        chunk_inputs.append(tuple(tokenizer.build_inputs_with_special_tokens(prefix_ids + ids[start:end])))
+    
+    logger.info(f"Token chunking: {len(ids)} tokens, budget={budget}, body_target={body_target}, overlap={overlap}, {len(chunks)} chunks, sizes: {[len(c) for c in chunk_inputs]}")
+    return chunks, chunk_inputs
+
 def calculate_summary_params(text_length: int, detail_level: str, format_type: str):
     detail_ratios = {
         "low": {"ratio": 0.20, "min_chars": 800, "max_chars": 3000},
@@ -208,86 +492,309 @@ def calculate_summary_params(text_length: int, detail_level: str, format_type: s
     
     return min_tokens, max_tokens, target_length
 
-def run_summarization(text: str, model_key: str, max_length: int, min_length: int, detail_level: str):
+def run_generation_batch(model_key: str, inputs: List[ModelInput], gen_kwargs: dict) -> List[str]:
+    metrics.BATCH_SIZE.labels(model_key).observe(len(inputs))
+    with metrics.timed("generate_batch", model_key):
+        return run_batch(summarizers[model_key], inputs, gen_kwargs)
+
+class DeferredGeneration(Future):
+    def __init__(self, fn: Callable[[], str]):
+        super().__init__()
+        self._fn = fn
+    
+    def result(self, timeout=None):
+        if not self.done() and self.set_running_or_notify_cancel():
+            try:
+                self.set_result(self._fn())
+            except Exception as e:
+                self.set_exception(e)
+        return super().result(timeout)
+
+def submit_generation(model_key: str, model_input: ModelInput, **gen_kwargs) -> Future:
+    if batch_scheduler is not None:
+        return batch_scheduler.submit(model_key, model_input, **gen_kwargs)
+    return DeferredGeneration(lambda: run_generation_batch(model_key, [model_input], gen_kwargs)[0])
+
+def generate_summary(model_key: str, text: str, **gen_kwargs) -> str:
+    return submit_generation(model_key, text, **gen_kwargs).result()
+
+GENERATION_LENGTH_BUCKETS = (40, 60, 80, 100, 120, 150, 180)
+
+def bucket_length(value: int) -> int:
+    """Round a length cap up to a fixed bucket so chunks of similar size share a generation batch."""
+    return next((b for b in GENERATION_LENGTH_BUCKETS if b >= value), value)
+
+def chunk_generation_params(chunk: str, is_last_chunk: bool, detail_level: str, tier: str = "quality") -> dict:
+    word_count = len(chunk.split())
+
+    if is_last_chunk:
+        if detail_level == "high":
+            chunk_max = bucket_length(min(180, max(100, word_count // 2)))
+            chunk_min = max(50, chunk_max // 2)
+        elif detail_level == "medium":
+            chunk_max = bucket_length(min(150, max(80, word_count // 3)))
+            chunk_min = max(40, chunk_max // 2)
+        else:
+            chunk_max = bucket_length(min(120, max(60, word_count // 4)))
+            chunk_min = max(30, chunk_max // 2)
+    else:
+        if detail_level == "high":
+            chunk_max = bucket_length(min(150, max(80, word_count // 3)))
+            chunk_min = max(40, chunk_max // 2)
+        elif detail_level == "medium":
+            chunk_max = bucket_length(min(120, max(60, word_count // 4)))
+            chunk_min = max(30, chunk_max // 2)
+        else:
+            chunk_max = bucket_length(min(80, max(40, word_count // 5)))
+            chunk_min = max(20, chunk_max // 2)
+
+    return apply_tier({
+        "max_length": chunk_max,
+        "min_length": chunk_min,
+        "do_sample": False,
+        "truncation": True
+    }, tier, is_last_chunk)
+
+def consolidation_params(max_length: int, min_length: int, tier: str) -> dict:
+    gen_kwargs = {
+        "max_length": max_length,
+        "min_length": min_length,
+        "do_sample": False,
+        "truncation": True
+    }
+    if tier == "quality":
+        # The consolidation pass has always run without the chunk-level penalties; keep it exact.
+        return {**gen_kwargs, "length_penalty": 1.2, "num_beams": 4}
+    return apply_tier(gen_kwargs, tier)
+
+def chunk_for_model(text: str, model_key: str, document: Optional[Document] = None):
+    if document is None or document.text is not text:
+        document = Document(text)
+    text_length = len(text)
+    target_chunks = max(4, min(8, text_length // 500))
+    if model_key in tokenizers:
+        return token_chunk_text(document, model_key, target_chunks)
+    if chunk_cache is not None:
+        chunks = stable_chunk_text(document, target_chunk_size=max(600, text_length // target_chunks))
+    else:
+        chunks = intelligent_chunk_text(document, target_chunks=target_chunks)
+    return chunks, chunks
+
+class SummarizationCancelled(Exception):
+    pass
+
+def coverage_order(count: int) -> List[int]:
+    """Chunk indexes ordered so every prefix spreads over the document: both ends, then repeated midpoints."""
+    if count <= 2:
+        return list(range(count))
+    order = [0, count - 1]
+    spans = deque([(0, count - 1)])
+    while spans:
+        lo, hi = spans.popleft()
+        if hi - lo < 2:
+            continue
+        mid = (lo + hi) // 2
+        order.append(mid)
+        spans.extend([(lo, mid), (mid, hi)])
+    return order
+
+def extractive_fallback(text: str) -> str:
+    return select_sentences(text, FALLBACK_SUMMARY_CHARS)[0]
+
+def budget_left(budget_deadline: Optional[float]) -> Optional[float]:
+    return None if budget_deadline is None else budget_deadline - time.monotonic()
+
+def _submit_timed_generation(model_key: str, model_input: ModelInput, gen_kwargs: dict) -> Future:
+    submitted = time.perf_counter()
+    future = submit_generation(model_key, model_input, **gen_kwargs)
+    metrics.CHUNKS.labels(model_key, "model").inc()
+    
+    def observe(done: Future):
+        if not done.cancelled():
+            metrics.observe_stage("chunk_generate", time.perf_counter() - submitted, model_key)
+    
+    future.add_done_callback(observe)
+    return future
+
+def count_generations(stats: dict):
+    """Set ``chunks_generated`` to the submitted generations that completed; cancelled or failed ones were not generated."""
+    generations = stats.pop("generations", ())
+    stats["chunks_generated"] = sum(1 for future in generations if future.done() and not future.cancelled() and future.exception() is None)
+
+def submit_chunk_generation(model_key: str, chunk: str, model_input: ModelInput, gen_kwargs: dict, stats: dict) -> Future:
+    if chunk_cache is None:
+        future = _submit_timed_generation(model_key, model_input, gen_kwargs)
+        stats["generations"].append(future)
+        return future
+    
+    key = content_key(chunk, model=resolve_model_key(model_key), backend=model_backend(resolve_model_key(model_key)), **gen_kwargs)
+    cached = chunk_cache.get(key)
+    if cached is not None:
+        stats["chunks_reused"] += 1
+        metrics.CHUNKS.labels(model_key, "cache").inc()
+        future = Future()
+        future.set_result(cached["summary"])
+        return future
+    
+    future = _submit_timed_generation(model_key, model_input, gen_kwargs)
+    stats["generations"].append(future)
+    
+    def remember(done: Future):
+        if not done.cancelled() and done.exception() is None:
+            chunk_cache.put(key, {"summary": done.result()})
+    
+    future.add_done_callback(remember)
+    return future
+
+def run_summarization(text: str, model_key: str, max_length: int, min_length: int, detail_level: str,
+                      on_chunk: Optional[Callable[[int, int, str], None]] = None,
+                      cancel_event: Optional[threading.Event] = None,
+                      tier: str = "quality",
+                      budget_deadline: Optional[float] = None,
+                      document: Optional[Document] = None):
+    """Summarize ``text`` chunk by chunk.
+
+    With ``budget_deadline`` (a ``time.monotonic()`` value), chunks are awaited in coverage
+    order until the deadline and the rest are filled with extractive summaries; the mode of
+    each chunk is reported in ``stats["chunk_modes"]``. ``document`` is the sentence index of
+    ``text`` when the caller already has one.
+    """
+    timings = {}
+    stats = {"chunks_processed": 1, "chunks_reused": 0, "chunks_generated": 0, "fallbacks": 0, "timings": timings,
+             "chunk_modes": ["abstractive"], "budget_exhausted": False, "generations": []}
     try:
-        summarizer = summarizers[model_key]
+        if model_key not in summarizers:
+            raise KeyError(f"Model not loaded: {model_key}")
         text_length = len(text)
         
         logger.info(f"Starting summarization: model={model_key}, text_length={text_length}, detail_level={detail_level}")
         
+        if settings.HIERARCHICAL_ENABLED and text_length >= settings.HIERARCHICAL_MIN_CHARS:
+            return run_hierarchical_summarization(
+                text_windows(text, settings.HIERARCHICAL_WINDOW_CHARS), model_key, detail_level,
+                on_chunk=on_chunk, cancel_event=cancel_event, tier=tier, expected_length=text_length,
+                budget_deadline=budget_deadline
+            )
+        
         if text_length <= 2000:
             word_count = len(text.split())
             safe_max = min(max_length, max(50, word_count // 2))
             safe_min = max(min_length, min(25, safe_max // 3))
             
-            result = summarizer(
-                text,
-                max_length=safe_max,
-                min_length=safe_min,
-                do_sample=False,
-                truncation=True,
-                early_stopping=True
-            )
-            return result[0]['summary_text'].strip()
+            gen_kwargs = {
+                "max_length": safe_max,
+                "min_length": safe_min,
+                "do_sample": False,
+                "truncation": True,
+                "early_stopping": True
+            }
+            if tier != "quality":
+                gen_kwargs = apply_tier(gen_kwargs, tier)
+            timed_out = False
+            with metrics.timed("generate", model_key, timings):
+                remaining = budget_left(budget_deadline)
+                if remaining is not None and remaining <= 0:
+                    summary = ""
+                    timed_out = True
+                else:
+                    future = submit_chunk_generation(model_key, text, text, gen_kwargs, stats)
+                    try:
+                        summary = future.result(timeout=remaining).strip()
+                    except TimeoutError:
+                        future.cancel()
+                        summary = ""
+                        timed_out = True
+            if not summary:
+                summary = extractive_fallback(text)
+                stats["chunk_modes"] = ["extractive"]
+                stats["fallbacks"] += 1
+                if timed_out:
+                    stats["budget_exhausted"] = True
+                    metrics.FALLBACKS.labels("time_budget").inc()
+                else:
+                    metrics.FALLBACKS.labels("empty").inc()
+                    logger.warning("Model returned an empty summary, using extractive fallback")
+            if on_chunk is not None:
+                on_chunk(0, 1, summary)
+            return summary, stats
         
-        target_chunks = max(4, min(8, text_length // 500))
-        chunks = intelligent_chunk_text(text, target_chunks=target_chunks)
+        if document is None or document.text is not text:
+            document = Document(text)
+        with metrics.timed("chunk", model_key, timings):
+            chunks, chunk_inputs = chunk_for_model(text, model_key, document)
+            chunk_starts = document.locate(chunks)
+        
+        def chunk_sentences(i: int) -> List[str]:
+            if chunk_starts[i] < 0:
+                return Document(chunks[i]).sentences()
+            return document.span_sentences(chunk_starts[i], chunk_starts[i] + len(chunks[i]))
+        stats["chunks_processed"] = len(chunks)
+        stats["chunk_modes"] = ["omitted"] * len(chunks)
         logger.info(f"Processing {len(chunks)} chunks for complete coverage")
         
+        order = range(len(chunks)) if budget_deadline is None else coverage_order(len(chunks))
+        chunk_futures = [None] * len(chunks)
+        for i in order:
+            chunk = chunks[i]
+            is_last_chunk = (i == len(chunks) - 1)
+            gen_kwargs = chunk_generation_params(chunk, is_last_chunk, detail_level, tier)
+            logger.debug("Processing chunk %d/%d: %d chars -> %d-%d tokens", i + 1, len(chunks), len(chunk), gen_kwargs['min_length'], gen_kwargs['max_length'])
+            chunk_futures[i] = submit_chunk_generation(model_key, chunk, chunk_inputs[i], gen_kwargs, stats)
+        
+        logger.debug("Chunk memoization: %d reused, %d submitted", stats["chunks_reused"], len(stats["generations"]))
+        
+        expired = set()
+        if budget_deadline is not None:
+            with metrics.timed("budgeted_generate", model_key, timings):
+                for i in order:
+                    remaining = budget_left(budget_deadline)
+                    if remaining <= 0 or (cancel_event is not None and cancel_event.is_set()):
+                        break
+                    try:
+                        chunk_futures[i].result(timeout=remaining)
+                    except TimeoutError:
+                        break
+                    except Exception:
+                        pass
+            expired = {i for i, future in enumerate(chunk_futures) if not future.done()}
+            for i in expired:
+                chunk_futures[i].cancel()
+            if expired:
+                stats["budget_exhausted"] = True
+                logger.info(f"Time budget exhausted with {len(expired)}/{len(chunks)} chunks pending, using extractive summaries")
+        
         chunk_summaries = []
         successful_chunks = 0
+        generate_started = time.perf_counter()
         
         for i, chunk in enumerate(chunks):
+            if cancel_event is not None and cancel_event.is_set():
+                for pending in chunk_futures[i:]:
+                    pending.cancel()
+                raise SummarizationCancelled(f"Cancelled after {i}/{len(chunks)} chunks")
+            
             is_last_chunk = (i == len(chunks) - 1)
+            summaries_before = len(chunk_summaries)
+            if i in expired:
+                chunk_summaries.append(extractive_fallback(chunk))
+                stats["chunk_modes"][i] = "extractive"
+                stats["fallbacks"] += 1
+                metrics.FALLBACKS.labels("time_budget").inc()
+                if on_chunk is not None:
+                    on_chunk(i, len(chunks), chunk_summaries[-1])
+                continue
             try:
-                word_count = len(chunk.split())
-                
-                if is_last_chunk:
-                    if detail_level == "high":
-                        chunk_max = min(180, max(100, word_count // 2))
-                        chunk_min = max(50, chunk_max // 2)
-                    elif detail_level == "medium":
-                        chunk_max = min(150, max(80, word_count // 3))
-                        chunk_min = max(40, chunk_max // 2)
-                    else:
-                        chunk_max = min(120, max(60, word_count // 4))
-                        chunk_min = max(30, chunk_max // 2)
-                    logger.info(f"🎬 LAST CHUNK - Extra tokens allocated: {chunk_min}-{chunk_max}")
-                else:
-                    if detail_level == "high":
-                        chunk_max = min(150, max(80, word_count // 3))
-                        chunk_min = max(40, chunk_max // 2)
-                    elif detail_level == "medium":
-                        chunk_max = min(120, max(60, word_count // 4))
-                        chunk_min = max(30, chunk_max // 2)
-                    else:
-                        chunk_max = min(80, max(40, word_count // 5))
-                        chunk_min = max(20, chunk_max // 2)
-                
-                logger.info(f"Processing chunk {i+1}/{len(chunks)}: {len(chunk)} chars, {word_count} words -> {chunk_min}-{chunk_max} tokens")
-                
-                result = summarizer(
-                    chunk,
-                    max_length=chunk_max,
-                    min_length=chunk_min,
-                    do_sample=False,
-                    truncation=True,
-                    early_stopping=True,
-                    length_penalty=1.3 if is_last_chunk else 1.2,
-                    num_beams=4,
-                    repetition_penalty=1.1
-                )
-                
-                summary = result[0]['summary_text'].strip()
+                summary = chunk_futures[i].result().strip()
                 
                 min_length_threshold = 20 if is_last_chunk else 30
                 
                 if summary and len(summary) > min_length_threshold:
                     chunk_summaries.append(summary)
+                    stats["chunk_modes"][i] = "abstractive"
                     successful_chunks += 1
-                    logger.info(f"✓ Chunk {i+1}{' (ENDING)' if is_last_chunk else ''}: Generated {len(summary)} chars: '{summary[:80]}...'")
+                    logger.debug("Chunk %d%s: generated %d chars", i + 1, " (ENDING)" if is_last_chunk else "", len(summary))
                 else:
-                    sentences = re.split(r'(?<=[.!?])\s+', chunk)
+                    sentences = chunk_sentences(i)
                     
                     if is_last_chunk and len(sentences) >= 1:
                         fallback_sentences = min(5, len(sentences))
@@ -295,31 +802,45 @@ def run_summarization(text: str, model_key: str, max_length: int, min_length: in
                         if not fallback_summary.endswith('.'):
                             fallback_summary += "."
                         chunk_summaries.append(fallback_summary)
+                        stats["fallbacks"] += 1
+                        metrics.FALLBACKS.labels("ending").inc()
                         logger.warning(f"⚠ ENDING CHUNK fallback ({fallback_sentences} sentences): {len(fallback_summary)} chars")
                     elif len(sentences) >= 2:
                         fallback_summary = ". ".join(sentences[:3])
                         chunk_summaries.append(fallback_summary)
+                        stats["fallbacks"] += 1
+                        metrics.FALLBACKS.labels("chunk").inc()
                         logger.warning(f"⚠ Chunk {i+1} using fallback: {len(fallback_summary)} chars")
                 
             except Exception as e:
                 logger.error(f"✗ Error processing chunk {i+1}: {e}")
-                sentences = re.split(r'(?<=[.!?])\s+', chunk)
+                sentences = chunk_sentences(i)
                 if sentences and len(sentences) >= 1:
                     if is_last_chunk:
                         emergency_sentences = min(3, len(sentences))
                         emergency_summary = ". ".join(sentences[-emergency_sentences:])
+                        metrics.FALLBACKS.labels("emergency_ending").inc()
                         logger.warning(f"⚠ ENDING CHUNK emergency fallback: {len(emergency_summary)} chars")
                     else:
                         emergency_summary = sentences[0]
+                        metrics.FALLBACKS.labels("emergency").inc()
                         logger.warning(f"⚠ Emergency fallback for chunk {i+1}")
                     
                     if len(emergency_summary) > 15:
                         chunk_summaries.append(emergency_summary)
+                        stats["fallbacks"] += 1
+            
+            if len(chunk_summaries) > summaries_before and stats["chunk_modes"][i] != "abstractive":
+                stats["chunk_modes"][i] = "extractive"
+            if on_chunk is not None and len(chunk_summaries) > summaries_before:
+                on_chunk(i, len(chunks), chunk_summaries[-1])
+        
+        metrics.observe_stage("generate", time.perf_counter() - generate_started, model_key, timings)
         
         if len(chunks) > 1 and len(chunk_summaries) < len(chunks):
+            metrics.FALLBACKS.labels("recovered_ending").inc()
             logger.warning("Possible missing ending - attempting recovery")
-            last_chunk = chunks[-1]
-            sentences = re.split(r'(?<=[.!?])\s+', last_chunk)
+            sentences = chunk_sentences(len(chunks) - 1)
             if len(sentences) >= 2:
                 emergency_ending = ". ".join(sentences[-3:])
                 chunk_summaries.append(f"[ENDING] {emergency_ending}")
@@ -344,7 +865,7 @@ def run_summarization(text: str, model_key: str, max_length: int, min_length: in
         else:
             preliminary_combined = ". ".join(chunk_summaries)
             
-            if len(preliminary_combined) > 8000 and detail_level == "low":
+            if len(preliminary_combined) > 8000 and detail_level == "low" and (budget_deadline is None or budget_left(budget_deadline) > 0):
                 try:
                     word_count = len(preliminary_combined.split())
                     final_max = min(180, word_count // 3)
@@ -352,17 +873,14 @@ def run_summarization(text: str, model_key: str, max_length: int, min_length: in
                     
                     logger.info(f"Final consolidation: {len(preliminary_combined)} chars -> target ~{final_max*5} chars")
                     
-                    final_result = summarizer(
-                        preliminary_combined,
-                        max_length=final_max,
-                        min_length=final_min,
-                        do_sample=False,
-                        truncation=True,
-                        length_penalty=1.2,
-                        num_beams=4
-                    )
-                    combined_summary = final_result[0]['summary_text'].strip()
+                    with metrics.timed("consolidate", model_key, timings):
+                        combined_summary = generate_summary(
+                            model_key,
+                            preliminary_combined,
+                            **consolidation_params(final_max, final_min, tier)
+                        ).strip()
                 except Exception as e:
+                    metrics.FALLBACKS.labels("consolidation").inc()
                     logger.warning(f"Final consolidation failed: {e}, using full combined summary")
                     combined_summary = preliminary_combined
             else:
@@ -374,129 +892,938 @@ def run_summarization(text: str, model_key: str, max_length: int, min_length: in
         
         logger.info(f"Final summary: {len(combined_summary)} characters from {len(chunk_summaries)} chunks")
         
-        return combined_summary
+        return combined_summary, stats
         
+    except SummarizationCancelled as e:
+        logger.info(f"Summarization cancelled: {e}")
+        stats["cancelled"] = True
+        return None, stats
     except Exception as e:
         logger.error(f"Summarization error: {e}")
-        return None
+        return None, stats
+    finally:
+        count_generations(stats)
 
-@app.post("/summarize", response_model=SummarizeResponse)
-async def summarize_text(request: SummarizeRequest):
+def text_windows(text: str, size: int) -> Iterator[str]:
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
+
+def leaf_token_budget(model_key: str):
+    tokenizer = tokenizers.get(model_key)
+    if tokenizer is None:
+        return None, None
+    resolved = resolve_model_key(model_key)
+    prefix = MODEL_PREFIXES.get(resolved, "")
+    prefix_tokens = len(tokenizer(prefix, add_special_tokens=False)["input_ids"]) if prefix else 0
+    budget = max_input_tokens(resolved, tokenizer) - tokenizer.num_special_tokens_to_add(pair=False) - prefix_tokens
+    return (lambda text: len(tokenizer(text, add_special_tokens=False, verbose=False)["input_ids"])), budget
+
+def run_hierarchical_summarization(pieces: Iterable[str], model_key: str, detail_level: str,
+                                   on_chunk: Optional[Callable[[int, Optional[int], str], None]] = None,
+                                   cancel_event: Optional[threading.Event] = None,
+                                   tier: str = "quality",
+                                   expected_length: int = 0,
+                                   budget_deadline: Optional[float] = None):
+    """Map-reduce summarization over a stream of text pieces.
+
+    Leaves of bounded token size are summarized through the batch scheduler and reduced level
+    by level as they complete, so only the current leaf buffer and a few summaries per level
+    are held regardless of document size.
+    """
+    timings = {}
+    stats = {"chunks_processed": 0, "chunks_reused": 0, "chunks_generated": 0, "fallbacks": 0, "timings": timings,
+             "budget_exhausted": False, "generations": []}
+    reducer = None
     try:
+        if model_key not in summarizers:
+            raise KeyError(f"Model not loaded: {model_key}")
+        
+        count_tokens, max_tokens = leaf_token_budget(model_key)
+        splitter = LeafSplitter(settings.HIERARCHICAL_LEAF_CHARS, count_tokens, max_tokens)
+        
+        def submit_node(text: str, level: int) -> Future:
+            gen_kwargs = chunk_generation_params(text, False, detail_level, tier)
+            return submit_chunk_generation(model_key, text, text, gen_kwargs, stats)
+        
+        def fallback(text: str) -> str:
+            metrics.FALLBACKS.labels("hierarchical").inc()
+            return extractive_fallback(text)
+        
+        def check_cancelled():
+            if cancel_event is not None and cancel_event.is_set():
+                raise SummarizationCancelled(f"Cancelled after {reducer.leaves} leaves")
+        
+        def on_leaf(index: int, summary: str):
+            if on_chunk is not None:
+                on_chunk(index, None, summary)
+        
+        reducer = TreeReducer(submit_node, fallback, settings.HIERARCHICAL_FAN_IN, check_cancelled, on_leaf, budget_deadline)
+        started = time.perf_counter()
+        for piece in pieces:
+            for leaf in splitter.feed(piece):
+                reducer.add_leaf(leaf)
+        for leaf in splitter.finish():
+            reducer.add_leaf(leaf)
+        if not reducer.leaves:
+            raise Exception("No text to summarize")
+        
+        target_chars = calculate_summary_params(max(expected_length, splitter.consumed_chars), detail_level, "")[2]
+        summary = reducer.finish(target_chars).strip()
+        metrics.observe_stage("hierarchical", time.perf_counter() - started, model_key, timings)
+        
+        stats["chunks_processed"] = reducer.leaves
+        stats["fallbacks"] = reducer.fallbacks
+        stats["input_chars"] = splitter.consumed_chars
+        stats["levels"] = reducer.level_stats()
+        stats["chunk_modes"] = reducer.leaf_modes
+        stats["budget_exhausted"] = reducer.budget_exhausted
+        for level in stats["levels"]:
+            if level["ms"] is not None:
+                metrics.observe_stage(f"level{level['level']}", level["ms"] / 1000, model_key, timings)
+        if not summary.endswith(('.', '!', '?')):
+            summary += "."
+        
+        logger.info(f"Hierarchical summary: {splitter.consumed_chars} chars, {reducer.leaves} leaves, "
+                    f"{len(stats['levels'])} levels -> {len(summary)} chars")
+        return summary, stats
+    
+    except SummarizationCancelled as e:
+        logger.info(f"Hierarchical summarization cancelled: {e}")
+        reducer.cancel_pending()
+        stats["cancelled"] = True
+        return None, stats
+    except Exception as e:
+        logger.error(f"Hierarchical summarization error: {e}")
+        if reducer is not None:
+            reducer.cancel_pending()
+        return None, stats
+    finally:
+        count_generations(stats)
+
+def resolve_token_limits(request: SummarizeRequest, text_length: int):
+    min_tokens, max_tokens, target_length = calculate_summary_params(
+        text_length, request.detail_level, request.format
+    )
+    
+    if request.max_length:
+        max_tokens = min(request.max_length // 4, 250)
+    if request.min_length:
+        min_tokens = max(request.min_length // 6, 30)
+    
+    if min_tokens >= max_tokens:
+        max_tokens = min_tokens + 50
+    
+    return min_tokens, max_tokens
+
+def served_models() -> List[str]:
+    routed = settings.ROUTER_MODELS if settings.ROUTER_ENABLED else []
+    return [model_key for model_key in MODEL_SPECS if model_key in ("bart", "t5") or model_key in routed]
+
+def is_model_ready(model_key: str) -> bool:
+    return model_states.get(model_key, {}).get("state") == "ready"
+
+def route_model(text_length: int, format_type: str, detail_level: str) -> str:
+    if model_router is None:
+        return select_model_key(text_length, format_type)
+    families = ["t5"] if format_type == "simplified" and text_length <= 1500 else None
+    model_key, reason, preferred = model_router.route(
+        detail_level, text_length // 4, families, admission.waiting(), admission.max_concurrent, is_model_ready
+    )
+    if preferred != model_key:
+        ensure_model_loaded(preferred)
+    metrics.ROUTING_DECISIONS.labels(model_key, reason).inc()
+    logger.info(f"Routed {text_length} chars at detail={detail_level} to {model_key} ({reason})")
+    return model_key
+
+def select_model_key(text_length: int, format_type: str) -> str:
+    if text_length > 1500:
+        model_key = "pegasus" if "pegasus" in MODEL_ALIASES else "bart"
+        logger.info(f"Using model: {model_key} for long text ({text_length} chars)")
+    elif format_type == "tldr":
+        model_key = "bart"
+    elif format_type == "simplified":
+        model_key = "t5"
+    else:
+        model_key = "bart"
+    return model_key
+
+CLAUSE_BREAK = re.compile(r'[,;]\s+(?:and|but|while|however|although|meanwhile|additionally|furthermore)\s+')
+
+def format_summary(summary: str, format_type: str, text_length: int) -> str:
+    if format_type == "bullet_points":
+        sentences = Document(summary.strip()).sentences()
+        sentences = [s.strip() for s in sentences if len(s.strip()) > 15]
+        
+        min_bullets = max(5, len(sentences) // 3)
+        
+        if len(sentences) < min_bullets and text_length > 2000:
+            extended_sentences = []
+            for sentence in sentences:
+                parts = CLAUSE_BREAK.split(sentence)
+                for part in parts:
+                    part = part.strip()
+                    if len(part) > 20:
+                        extended_sentences.append(part)
+            
+            if len(extended_sentences) > len(sentences):
+                sentences = extended_sentences
+        
+        bullet_points = []
+        for i, sentence in enumerate(sentences[:20]):
+            sentence = sentence.strip()
+            if sentence:
+                if not sentence.endswith(('.', '!', '?')):
+                    sentence += '.'
+                
+                if any(keyword in sentence.lower() for keyword in ['climax', 'ending', 'final', 'conclusion', 'train', 'ja simran', 'boards', 'pulls']):
+                    bullet_points.append(f"• 🎬 {sentence}")
+                else:
+                    bullet_points.append(f"• {sentence}")
+        
+        return "\n".join(bullet_points)
+        
+    elif format_type == "tldr":
+        return f"TL;DR: {summary.strip()}"
+    else:
+        return summary.strip()
+
+def validate_scheduling(priority: str, quality_tier: str):
+    if priority not in PRIORITIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown priority '{priority}'. Use one of: {', '.join(PRIORITIES)}"
+        )
+    
+    if quality_tier != AUTO_TIER and quality_tier not in DECODING_TIERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown quality_tier '{quality_tier}'. Use one of: {', '.join([AUTO_TIER, *DECODING_TIERS])}"
+        )
+
+def select_tier(quality_tier: str) -> str:
+    if quality_tier != AUTO_TIER:
+        tier = quality_tier
+    elif tier_selector is not None and admission is not None:
+        tier = tier_selector.choose(admission.waiting(), admission.max_concurrent)
+    else:
+        tier = "quality"
+    metrics.TIER_SELECTIONS.labels(tier, quality_tier).inc()
+    return tier
+
+async def admit_request(model_key: str, priority: str, deadline: Optional[float]) -> AdmissionTicket:
+    try:
+        return await admission.acquire(resolve_model_key(model_key), priority, deadline)
+    except AdmissionRejected as e:
+        metrics.REJECTIONS.labels(e.model_key, e.reason).inc()
+        logger.warning(f"Rejecting {priority} request: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail=f"Server busy: {e.reason.lower()}",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
+
+def validate_options(request: SummarizeRequest):
+    """Reject scheduling options that would fail every run of ``request``, before any work is queued."""
+    validate_scheduling(request.priority, request.quality_tier)
+    
+    if request.deadline_ms is not None and request.deadline_ms <= 0:
+        raise HTTPException(status_code=400, detail="deadline_ms must be positive")
+    
+    if request.time_budget_ms is not None and request.time_budget_ms <= 0:
+        raise HTTPException(status_code=400, detail="time_budget_ms must be positive")
+
+class SummaryJob:
+    def __init__(self, request: SummarizeRequest):
         if not request.text or len(request.text.strip()) < 50:
             raise HTTPException(
                 status_code=400,
                 detail="Text too short. Minimum 50 characters required."
             )
-
-        cleaned_text = clean_text(request.text)
-        text_length = len(cleaned_text)
         
-        logger.info(f"Processing request: length={text_length}, detail={request.detail_level}, format={request.format}")
+        validate_options(request)
+        
+        self.request = request
+        self.started_at = time.monotonic()
+        self.deadline = time.monotonic() + request.deadline_ms / 1000 if request.deadline_ms is not None else None
+        self.budget_deadline = self.started_at + request.time_budget_ms / 1000 if request.time_budget_ms is not None else None
+        self.timings = {}
+        with metrics.timed("clean", timings=self.timings):
+            self.document = preprocess_text(request.text)
+            self.cleaned_text = self.document.text
+        self.preprocessing = None
+        if boilerplate_filter is not None:
+            self.strip_boilerplate()
+        self.text_length = len(self.cleaned_text)
+        self.extractive = request.format == "extractive"
+        
+        logger.info(f"Processing request: length={self.text_length}, detail={request.detail_level}, format={request.format}")
+        
+        self.model_text = self.cleaned_text
+        self.prefilter_budget = None
+        if not self.extractive:
+            self.prefilter()
+        
+        with metrics.timed("params", timings=self.timings):
+            self.min_tokens, self.max_tokens = resolve_token_limits(request, self.text_length)
+            self.model_key = route_model(len(self.model_text), request.format, request.detail_level)
+            self.tier = None if self.extractive else select_tier(request.quality_tier)
+        if self.preprocessing is not None:
+            self.count_preprocessing_tokens()
+    
+    @classmethod
+    async def create(cls, request: SummarizeRequest) -> "SummaryJob":
+        """Build the job in a worker thread: preprocessing, boilerplate lookups, the prefilter and
+        token counting all scale with the text and would otherwise stall the event loop."""
+        return await asyncio.get_event_loop().run_in_executor(None, cls, request)
+    
+    def strip_boilerplate(self):
+        """Drop repeated and boilerplate blocks; the block structure only survives in the raw text."""
+        original = self.cleaned_text
+        with metrics.timed("boilerplate", timings=self.timings):
+            filtered, report = boilerplate_filter.filter(self.request.text, site_of(self.request.source_url))
+            if sum(report["blocks_removed"].values()):
+                filtered = preprocess_text(filtered)
+                if len(filtered) >= 50:
+                    self.document = filtered
+                    self.cleaned_text = filtered.text
+        for reason, count in report["blocks_removed"].items():
+            if count:
+                metrics.BOILERPLATE_BLOCKS.labels(reason).inc(count)
+        metrics.BOILERPLATE_CHARS.inc(len(original) - len(self.cleaned_text))
+        report["original_chars"] = len(original)
+        report["cleaned_chars"] = len(self.cleaned_text)
+        self._original_text = original
+        self.preprocessing = report
+        if len(self.cleaned_text) < len(original):
+            logger.info(f"Boilerplate removal: {len(original)} -> {len(self.cleaned_text)} chars, removed {report['blocks_removed']}")
+    
+    def count_preprocessing_tokens(self):
+        tokenizer = tokenizers.get(self.model_key)
+        
+        def count(text: str) -> int:
+            if tokenizer is None:
+                return int(len(text.split()) * 1.3)
+            return len(tokenizer(text, add_special_tokens=False, verbose=False)["input_ids"])
+        
+        self.preprocessing["cleaned_tokens"] = count(self.cleaned_text)
+        if self.preprocessing["cleaned_chars"] < self.preprocessing["original_chars"]:
+            self.preprocessing["original_tokens"] = count(self._original_text)
+        else:
+            self.preprocessing["original_tokens"] = self.preprocessing["cleaned_tokens"]
+        self.preprocessing["tokens_estimated"] = tokenizer is None
+    
+    def prefilter(self):
+        """Drop low-ranked sentences so only the informative part of long texts reaches the model.
 
-        min_tokens, max_tokens, target_length = calculate_summary_params(
-            text_length, request.detail_level, request.format
+        Texts long enough for map-reduce are left whole: the tree already condenses every
+        window, and cutting them first would drop them below the hierarchical threshold.
+        """
+        if not settings.PREFILTER_ENABLED or self.text_length < settings.PREFILTER_MIN_CHARS:
+            return
+        if settings.HIERARCHICAL_ENABLED and self.text_length >= settings.HIERARCHICAL_MIN_CHARS:
+            return
+        ratio = settings.PREFILTER_RATIOS.get(self.request.detail_level, settings.PREFILTER_RATIOS["medium"])
+        self.prefilter_budget = max(settings.PREFILTER_MIN_CHARS, int(self.text_length * ratio))
+        with metrics.timed("prefilter", timings=self.timings):
+            self.model_text, kept, total = select_sentences(self.cleaned_text, self.prefilter_budget, self.document.sentences())
+        logger.info(f"Prefilter kept {kept}/{total} sentences: {self.text_length} -> {len(self.model_text)} chars")
+    
+    def cache_key(self, tier: Optional[str] = None) -> str:
+        return content_key(
+            self.cleaned_text,
+            version=app.version,
+            model=resolve_model_key(self.model_key),
+            backend=model_backend(resolve_model_key(self.model_key)),
+            format=self.request.format,
+            detail_level=self.request.detail_level,
+            min_tokens=self.min_tokens,
+            max_tokens=self.max_tokens,
+            prefilter=self.prefilter_budget,
+            tier=tier or self.tier
         )
-        
-        if request.max_length:
-            max_tokens = min(request.max_length // 4, 250)
-        if request.min_length:
-            min_tokens = max(request.min_length // 6, 30)
-        
-        if min_tokens >= max_tokens:
-            max_tokens = min_tokens + 50
-        
-        if text_length > 1500:
-            model_key = "pegasus" if "pegasus" in summarizers else "bart"
-            logger.info(f"Using model: {model_key} for long text ({text_length} chars)")
-        elif request.format == "tldr":
-            model_key = "bart"
-        elif request.format == "simplified":
-            model_key = "t5"
+    
+    def cached_result(self) -> Tuple[Optional[str], Optional[dict]]:
+        """Return the cache key and result stored for this job, or ``(None, None)``.
+
+        When the tier was auto-selected, a result of any tier is accepted, best tier first, so
+        load-driven downgrades reuse the summaries already computed instead of regenerating.
+        """
+        tiers = [self.tier]
+        if self.request.quality_tier == AUTO_TIER and self.tier is not None:
+            tiers = list(reversed(DECODING_TIERS))
+        for tier in tiers:
+            key = self.cache_key(tier)
+            result = summary_cache.get(key)
+            if result is not None:
+                return key, result
+        return None, None
+    
+    def run(self, on_chunk=None, cancel_event: Optional[threading.Event] = None):
+        metrics.EXECUTOR_QUEUE_DEPTH.dec()
+        inflight = metrics.INFLIGHT.labels(self.model_key)
+        inflight.inc()
+        if model_router is not None:
+            model_router.begin(self.model_key)
+        started = time.perf_counter()
+        summary, stats = None, {}
+        try:
+            summary, stats = run_summarization(
+                self.model_text,
+                self.model_key,
+                self.max_tokens,
+                self.min_tokens,
+                self.request.detail_level,
+                on_chunk=on_chunk,
+                cancel_event=cancel_event,
+                tier=self.tier,
+                budget_deadline=self.budget_deadline,
+                document=self.document
+            )
+        finally:
+            inflight.dec()
+            if model_router is not None:
+                measured = summary is not None and not stats.get("chunks_reused") and not stats.get("budget_exhausted")
+                model_router.end(self.model_key, time.perf_counter() - started if measured else None, len(self.model_text) // 4)
+        self.timings.update(stats.pop("timings"))
+        return summary, stats
+    
+    def run_extractive(self):
+        if self.request.max_length:
+            budget = self.request.max_length
         else:
-            model_key = "bart"
-        
+            budget = calculate_summary_params(self.text_length, self.request.detail_level, self.request.format)[2]
+        with metrics.timed("extract", timings=self.timings):
+            summary, kept, total = select_sentences(self.cleaned_text, budget, self.document.sentences())
+        logger.info(f"Extractive summary: {kept}/{total} sentences, {len(summary)} chars")
+        return summary, {"chunks_processed": 0, "chunks_reused": 0, "chunks_generated": 0}
+    
+    def submit(self, on_chunk=None, cancel_event: Optional[threading.Event] = None) -> asyncio.Future:
+        metrics.EXECUTOR_QUEUE_DEPTH.inc()
         loop = asyncio.get_event_loop()
-        summary = await loop.run_in_executor(
-            executor,
-            run_summarization,
-            cleaned_text,
-            model_key,
-            max_tokens,
-            min_tokens,
-            request.detail_level
-        )
+        return loop.run_in_executor(executor, functools.partial(self.run, on_chunk=on_chunk, cancel_event=cancel_event))
+    
+    def deadline_passed(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+    
+    async def admit(self) -> AdmissionTicket:
+        return await admit_request(self.model_key, self.request.priority, self.deadline)
+    
+    async def execute(self, http_request: Optional[Request] = None, disconnect_guard: Optional[Callable[[], bool]] = None):
+        """Admit, run and watch the job, cancelling between chunks on disconnect or deadline.
+
+        ``disconnect_guard`` returning True keeps the work going after the client leaves,
+        e.g. while other requests are waiting on the same cached result.
+        """
+        if self.extractive:
+            return await asyncio.get_event_loop().run_in_executor(None, self.run_extractive)
         
+        ticket = await self.admit()
+        cancel_event = threading.Event()
+        try:
+            await wait_for_model(self.model_key)
+            if self.deadline_passed():
+                raise HTTPException(status_code=504, detail="Deadline exceeded while loading model")
+            
+            task = self.submit(cancel_event=cancel_event)
+            ticket.attach(task)
+            poll = settings.DISCONNECT_POLL_MS / 1000
+            while not task.done():
+                timeout = poll if self.deadline is None else max(0.0, min(poll, self.deadline - time.monotonic()))
+                await asyncio.wait({task}, timeout=timeout)
+                if task.done() or cancel_event.is_set():
+                    continue
+                if self.deadline_passed():
+                    logger.info("Deadline exceeded, cancelling summarization")
+                    cancel_event.set()
+                elif http_request is not None and await http_request.is_disconnected() and not (disconnect_guard and disconnect_guard()):
+                    logger.info("Client disconnected, cancelling summarization")
+                    cancel_event.set()
+            
+            summary, stats = await task
+            if stats.get("cancelled"):
+                if self.deadline_passed():
+                    raise HTTPException(status_code=504, detail="Deadline exceeded")
+                raise HTTPException(status_code=499, detail="Client closed request")
+            if tier_selector is not None:
+                tier_selector.record(time.monotonic() - self.started_at)
+            return summary, stats
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
+        finally:
+            ticket.release()
+    
+    def build_response(self, summary: Optional[str], stats: dict) -> dict:
         if not summary:
             raise HTTPException(
                 status_code=500,
                 detail="Failed to generate summary"
             )
         
-        if request.format == "bullet_points":
-            sentences = re.split(r'(?<=[.!?])\s+', summary.strip())
-            sentences = [s.strip() for s in sentences if len(s.strip()) > 15]
-            
-            min_bullets = max(5, len(sentences) // 3)
-            
-            if len(sentences) < min_bullets and text_length > 2000:
-                extended_sentences = []
-                for sentence in sentences:
-                    parts = re.split(r'[,;]\s+(?:and|but|while|however|although|meanwhile|additionally|furthermore)\s+', sentence)
-                    for part in parts:
-                        part = part.strip()
-                        if len(part) > 20:
-                            extended_sentences.append(part)
-                
-                if len(extended_sentences) > len(sentences):
-                    sentences = extended_sentences
-            
-            bullet_points = []
-            for i, sentence in enumerate(sentences[:20]):
-                sentence = sentence.strip()
-                if sentence:
-                    if not sentence.endswith(('.', '!', '?')):
-                        sentence += '.'
-                    
-                    if any(keyword in sentence.lower() for keyword in ['climax', 'ending', 'final', 'conclusion', 'train', 'ja simran', 'boards', 'pulls']):
-                        bullet_points.append(f"• 🎬 {sentence}")
-                    else:
-                        bullet_points.append(f"• {sentence}")
-            
-            formatted_summary = "\n".join(bullet_points)
-            
-        elif request.format == "tldr":
-            formatted_summary = f"TL;DR: {summary.strip()}"
-        else:
-            formatted_summary = summary.strip()
-        
-        target_chunks = max(4, min(8, text_length // 500)) if text_length > 2000 else 1
-        chunks_processed = len(intelligent_chunk_text(cleaned_text, target_chunks=target_chunks)) if text_length > 2000 else 1
+        with metrics.timed("format", self.model_key, self.timings):
+            formatted_summary = format_summary(summary, self.request.format, self.text_length)
+        chunks_processed = stats["chunks_processed"]
         
         logger.info(f"Summary generated: {len(formatted_summary)} chars from {chunks_processed} chunks")
         
         return SummarizeResponse(
             summary=formatted_summary,
-            format=request.format,
-            original_length=text_length,
+            format=self.request.format,
+            original_length=self.text_length,
             summary_length=len(formatted_summary),
             chunks_processed=chunks_processed,
-            detail_level=request.detail_level
-        )
+            detail_level=self.request.detail_level,
+            chunks_reused=stats["chunks_reused"],
+            chunks_generated=stats["chunks_generated"],
+            prefiltered_length=len(self.model_text) if self.prefilter_budget is not None else None,
+            quality_tier=self.tier,
+            preprocessing=self.preprocessing,
+            levels=stats.get("levels"),
+            chunk_modes=stats.get("chunk_modes"),
+            budget_exhausted=stats.get("budget_exhausted")
+        ).model_dump()
+
+CONTENT_HASH = re.compile(r"^(?:sha256:)?([0-9a-f]{64})$")
+
+def content_hash_key(content_hash: str, request) -> str:
+    """Cache key under which a client-side SHA-256 of the raw text points at the stored result."""
+    return content_key(
+        content_hash,
+        kind="content_hash",
+        version=app.version,
+        backends=settings.MODEL_BACKENDS,
+        format=request.format,
+        detail_level=request.detail_level,
+        max_length=request.max_length,
+        min_length=request.min_length,
+        quality_tier=request.quality_tier,
+        site=site_of(request.source_url)
+    )
+
+def browser_utf8(text: str) -> bytes:
+    """UTF-8 bytes as the browser's TextEncoder produces them, with lone surrogates as U+FFFD."""
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        return text.encode("utf-16-le", "surrogatepass").decode("utf-16-le", "replace").encode("utf-8")
+
+def remember_content_hash(request: SummarizeRequest, cache_key: str):
+    try:
+        content_hash = hashlib.sha256(browser_utf8(request.text)).hexdigest()
+        summary_cache.put(content_hash_key(content_hash, request), {"key": cache_key})
+    except Exception as e:
+        logger.warning(f"Could not store content hash pointer: {e}")
+
+def wants_server_timing(http_request: Request) -> bool:
+    return settings.TIMING_HEADER or http_request.headers.get("x-contentsnap-timing") == "1"
+
+@app.post("/summarize", response_model=SummarizeResponse)
+async def summarize_text(request: SummarizeRequest, http_request: Request, response: Response):
+    started = time.perf_counter()
+    status = "error"
+    cached = False
+    try:
+        job = await SummaryJob.create(request)
+        
+        if summary_cache is None:
+            cache_key = None
+            disconnect_guard = None
+        else:
+            cache_key = job.cache_key()
+            disconnect_guard = functools.partial(summary_cache.has_waiters, cache_key)
+        
+        async def generate() -> dict:
+            summary, stats = await job.execute(http_request, disconnect_guard)
+            return job.build_response(summary, stats)
         
-    except HTTPException:
+        hit_key, result = job.cached_result() if summary_cache is not None and request.use_cache else (None, None)
+        if result is not None:
+            cached = True
+            logger.info(f"Serving cached summary {hit_key[:12]}")
+            remember_content_hash(request, hit_key)
+        elif summary_cache is None:
+            result = await generate()
+        elif job.budget_deadline is not None:
+            result = await generate()
+            if not result["budget_exhausted"]:
+                summary_cache.put(cache_key, result)
+                remember_content_hash(request, cache_key)
+        else:
+            result, _ = await summary_cache.get_or_compute(cache_key, generate, bypass=True)
+            remember_content_hash(request, cache_key)
+        
+        status = "ok"
+        if wants_server_timing(http_request):
+            job.timings["total"] = (time.perf_counter() - started) * 1000
+            response.headers["Server-Timing"] = metrics.server_timing(job.timings)
+        return SummarizeResponse(**{**result, "cached": cached})
+        
+    except HTTPException as e:
+        status = str(e.status_code)
         raise
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
+    finally:
+        metrics.REQUESTS.labels("summarize", status).inc()
+        metrics.REQUEST_SECONDS.labels("summarize", str(cached).lower()).observe(time.perf_counter() - started)
+
+@app.post("/summarize/lookup", response_model=SummarizeResponse)
+async def summarize_lookup(request: SummarizeLookup):
+    """Answer from a stored result by content hash, so clients only upload text the server has not seen."""
+    match = CONTENT_HASH.match(request.content_hash.strip().lower())
+    if match is None:
+        raise HTTPException(status_code=400, detail="content_hash must be a hex SHA-256 of the UTF-8 text")
+    pointer = summary_cache.get(content_hash_key(match.group(1), request)) if summary_cache is not None else None
+    result = summary_cache.get(pointer["key"]) if pointer is not None else None
+    metrics.REQUESTS.labels("lookup", "hit" if result is not None else "miss").inc()
+    if result is None:
+        raise HTTPException(status_code=404, detail="Unknown content hash, upload the text to /summarize")
+    return SummarizeResponse(**{**result, "cached": True})
+
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.post("/summarize/stream")
+async def summarize_text_stream(request: SummarizeRequest):
+    job = await SummaryJob.create(request)
+    stream_headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    
+    if summary_cache is not None and request.use_cache:
+        _, cached = job.cached_result()
+        if cached is not None:
+            return StreamingResponse(
+                iter([_sse_event("done", {**cached, "cached": True})]),
+                media_type="text/event-stream",
+                headers=stream_headers
+            )
+    
+    if job.extractive:
+        summary, stats = await job.execute()
+        return StreamingResponse(
+            iter([_sse_event("done", job.build_response(summary, stats))]),
+            media_type="text/event-stream",
+            headers=stream_headers
+        )
+    
+    ticket = await job.admit()
+    
+    async def event_stream():
+        try:
+            await wait_for_model(job.model_key)
+        except HTTPException as e:
+            yield _sse_event("error", {"detail": e.detail})
+            return
+        
+        loop = asyncio.get_event_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        cancel_event = threading.Event()
+        
+        def on_chunk(index: int, total: int, chunk_summary: str):
+            loop.call_soon_threadsafe(events.put_nowait, {
+                "index": index,
+                "total": total,
+                "summary": chunk_summary,
+                "bullet_points": format_summary(chunk_summary, "bullet_points", 0)
+            })
+        
+        task = job.submit(on_chunk=on_chunk, cancel_event=cancel_event)
+        ticket.attach(task)
+        try:
+            while True:
+                next_event = asyncio.ensure_future(events.get())
+                timeout = None if job.deadline is None or cancel_event.is_set() else max(0.0, job.deadline - time.monotonic())
+                done, _ = await asyncio.wait({next_event, task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if next_event in done:
+                    yield _sse_event("chunk", next_event.result())
+                    continue
+                next_event.cancel()
+                if not done:
+                    logger.info("Deadline exceeded, cancelling streaming summarization")
+                    cancel_event.set()
+                    continue
+                while not events.empty():
+                    yield _sse_event("chunk", events.get_nowait())
+                break
+            
+            summary, stats = await task
+            if stats.get("cancelled"):
+                yield _sse_event("error", {"detail": "Deadline exceeded"})
+                return
+            if tier_selector is not None:
+                tier_selector.record(time.monotonic() - job.started_at)
+            try:
+                result = job.build_response(summary, stats)
+            except HTTPException as e:
+                yield _sse_event("error", {"detail": e.detail})
+                return
+            if summary_cache is not None and not result["budget_exhausted"]:
+                summary_cache.put(job.cache_key(), result)
+                remember_content_hash(request, job.cache_key())
+            yield _sse_event("done", result)
+        except Exception as e:
+            logger.error(f"Streaming error: {e}")
+            yield _sse_event("error", {"detail": "Internal server error"})
+        finally:
+            if not task.done():
+                cancel_event.set()
+                logger.info("Client disconnected, cancelling streaming summarization")
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers=stream_headers,
+        background=BackgroundTask(ticket.release)
+    )
+
+@app.post("/summarize/upload", response_model=SummarizeResponse)
+async def summarize_upload(http_request: Request, format: str = "bullet_points", detail_level: str = "medium",
+                           priority: str = "interactive", quality_tier: str = AUTO_TIER):
+    """Summarize a plain-text request body hierarchically while it is still being received."""
+    started = time.perf_counter()
+    status = "error"
+    try:
+        if format == "extractive":
+            raise HTTPException(status_code=400, detail="Extractive summaries need the full text; use /summarize")
+        validate_scheduling(priority, quality_tier)
+        expected_length = int(http_request.headers.get("content-length") or 0)
+        if expected_length > settings.UPLOAD_MAX_BYTES:
+            raise HTTPException(status_code=413, detail=f"Upload exceeds {settings.UPLOAD_MAX_BYTES} bytes")
+        
+        model_key = route_model(max(expected_length, settings.HIERARCHICAL_MIN_CHARS), format, detail_level)
+        tier = select_tier(quality_tier)
+        ticket = await admit_request(model_key, priority, None)
+        cancel_event = threading.Event()
+        try:
+            await wait_for_model(model_key)
+            loop = asyncio.get_event_loop()
+            pieces: asyncio.Queue = asyncio.Queue(maxsize=4)
+            
+            def receive() -> Iterator[str]:
+                while True:
+                    piece = asyncio.run_coroutine_threadsafe(pieces.get(), loop).result()
+                    if piece is None:
+                        return
+                    yield piece
+            
+            task = loop.run_in_executor(executor, functools.partial(
+                run_hierarchical_summarization, receive(), model_key, detail_level,
+                cancel_event=cancel_event, tier=tier, expected_length=expected_length
+            ))
+            ticket.attach(task)
+            
+            async def feed(piece: Optional[str]) -> bool:
+                put = asyncio.ensure_future(pieces.put(piece))
+                await asyncio.wait({put, task}, return_when=asyncio.FIRST_COMPLETED)
+                if not put.done():
+                    put.cancel()
+                return put.done() and not put.cancelled()
+            
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            normalizer = StreamNormalizer()
+            received = 0
+            try:
+                async for raw in http_request.stream():
+                    received += len(raw)
+                    if received > settings.UPLOAD_MAX_BYTES:
+                        raise HTTPException(status_code=413, detail=f"Upload exceeds {settings.UPLOAD_MAX_BYTES} bytes")
+                    if raw and not await feed(normalizer.feed(decoder.decode(raw))):
+                        break
+                else:
+                    tail = normalizer.feed(decoder.decode(b"", final=True))
+                    if not tail or await feed(tail):
+                        await feed(None)
+            except BaseException:
+                cancel_event.set()
+                while not pieces.empty():
+                    pieces.get_nowait()
+                pieces.put_nowait(None)
+                raise
+            
+            summary, stats = await task
+            if stats.get("cancelled"):
+                raise HTTPException(status_code=499, detail="Client closed request")
+            if not summary:
+                raise HTTPException(status_code=500, detail="Failed to generate summary")
+            formatted_summary = format_summary(summary, format, stats["input_chars"])
+        except ClientDisconnect:
+            logger.info("Client disconnected during upload, cancelling summarization")
+            raise HTTPException(status_code=499, detail="Client closed request")
+        finally:
+            ticket.release()
+        
+        status = "ok"
+        return SummarizeResponse(
+            summary=formatted_summary,
+            format=format,
+            original_length=stats["input_chars"],
+            summary_length=len(formatted_summary),
+            chunks_processed=stats["chunks_processed"],
+            detail_level=detail_level,
+            chunks_reused=stats["chunks_reused"],
+            chunks_generated=stats["chunks_generated"],
+            quality_tier=tier,
+            levels=stats["levels"]
+        )
+    except HTTPException as e:
+        status = str(e.status_code)
+        raise
+    finally:
+        metrics.REQUESTS.labels("upload", status).inc()
+        metrics.REQUEST_SECONDS.labels("upload", "false").observe(time.perf_counter() - started)
+
+class JobDocument(BaseModel):
+    id: Optional[str] = None
+    text: str
+    url: Optional[str] = None
+
+class JobOptions(BaseModel):
+    format: str = "bullet_points"
+    max_length: Optional[int] = None
+    min_length: Optional[int] = None
+    detail_level: str = "medium"
+    use_cache: bool = True
+    quality_tier: str = AUTO_TIER
+    source_url: Optional[str] = None
+    deadline_ms: Optional[int] = None
+    time_budget_ms: Optional[int] = None
+
+class JobRequest(JobOptions):
+    documents: List[JobDocument]
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl", "application/ndjson")
+
+async def summarize_job_document(text: str, options: dict) -> dict:
+    job = await SummaryJob.create(SummarizeRequest(text=text, priority="background", **options))
+    
+    async def generate() -> dict:
+        while True:
+            try:
+                summary, stats = await job.execute()
+                return job.build_response(summary, stats)
+            except HTTPException as e:
+                if e.status_code != 429:
+                    raise
+                await asyncio.sleep(int(e.headers["Retry-After"]))
+    
+    if summary_cache is None:
+        return await generate()
+    result, cached = await summary_cache.get_or_compute(job.cache_key(), generate, bypass=not job.request.use_cache)
+    return {**result, "cached": cached}
+
+def _parse_ndjson_documents(body: bytes) -> List[JobDocument]:
+    documents = []
+    for line_number, line in enumerate(body.decode("utf-8").splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+            documents.append(JobDocument(text=item) if isinstance(item, str) else JobDocument.model_validate(item))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid NDJSON on line {line_number}: {e}")
+    return documents
+
+def _require_jobs():
+    if job_store is None:
+        raise HTTPException(status_code=404, detail="Bulk jobs are disabled")
+
+@app.post("/jobs", status_code=202)
+async def create_job(http_request: Request):
+    _require_jobs()
+    content_type = http_request.headers.get("content-type", "").split(";")[0].strip().lower()
+    try:
+        if content_type in NDJSON_CONTENT_TYPES:
+            documents = _parse_ndjson_documents(await http_request.body())
+            options = JobOptions.model_validate(dict(http_request.query_params))
+        else:
+            job_request = JobRequest.model_validate_json(await http_request.body())
+            documents = job_request.documents
+            options = JobOptions.model_validate(job_request.model_dump(exclude={"documents"}))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid job request: {e}")
+    
+    if not documents:
+        raise HTTPException(status_code=400, detail="A job needs at least one document")
+    if len(documents) > settings.JOBS_MAX_DOCUMENTS:
+        raise HTTPException(status_code=413, detail=f"Too many documents: {len(documents)} > {settings.JOBS_MAX_DOCUMENTS}")
+    validate_options(SummarizeRequest(text="", priority="background", **options.model_dump()))
+    
+    job = job_store.create([(document.id, document.text, document.url) for document in documents], options.model_dump())
+    job_runner.notify()
+    logger.info(f"Created job {job['job_id']} with {job['total']} documents")
+    return job
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    _require_jobs()
+    job = job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.get("/jobs/{job_id}/results")
+async def get_job_results(job_id: str, after: int = 0, limit: int = 100):
+    _require_jobs()
+    job = job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    limit = max(1, min(limit, 1000))
+    results = job_store.results(job_id, after=after, limit=limit)
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "results": results,
+        "next_after": results[-1]["seq"] if results else after,
+        "finished": job["status"] in ("completed", "cancelled") and len(results) < limit
+    }
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    _require_jobs()
+    if not job_store.cancel(job_id):
+        if job_store.get(job_id) is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        raise HTTPException(status_code=409, detail="Job already finished")
+    return job_store.get(job_id)
+
+@app.get("/health/live")
+async def liveness_check():
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    state = readiness()
+    return JSONResponse(status_code=200 if state["ready"] else 503, content=state)
+
+def memory_breakdown() -> dict:
+    workers = []
+    if inference_pool is not None:
+        workers = [memory_report(w["pid"]) for w in inference_pool.health()["workers"] if w["alive"]]
+    return {"shared_weights": settings.SHARED_WEIGHTS, "api_worker": memory_report(), "pool_workers": workers}
 
 @app.get("/health")
 async def health_check():
+    state = readiness()
     return {
-        "status": "healthy",
+        "status": "healthy" if state["ready"] else "starting",
         "models_loaded": len(summarizers) > 0,
         "available_models": list(summarizers.keys()),
-        "available_formats": ["bullet_points", "tldr", "simplified", "detailed"],
+        "models": state["models"],
+        "admission": admission.stats() if admission is not None else None,
+        "decoding": {"tiers": DECODING_TIERS, **tier_selector.stats()} if tier_selector is not None else None,
+        "routing": model_router.stats() if model_router is not None else {"enabled": False},
+        "jobs": {**job_store.stats(), **job_runner.stats()} if job_runner is not None else {"enabled": False},
+        "batching": batch_scheduler.stats() if batch_scheduler is not None else {"enabled": False},
+        "model_backends": {model_key: model_backend(model_key) for model_key in MODEL_SPECS},
+        "inference": inference_pool.health() if inference_pool is not None else {"backend": "local"},
+        "memory": memory_breakdown(),
+        "cache": summary_cache.stats() if summary_cache is not None else {"enabled": False},
+        "chunk_cache": chunk_cache.stats() if chunk_cache is not None else {"enabled": False},
+        "boilerplate": boilerplate_filter.store.stats() if boilerplate_filter is not None else {"enabled": False},
+        "available_formats": ["bullet_points", "tldr", "simplified", "detailed", "extractive"],
+        "request_encodings": supported_encodings(),
         "detail_levels": ["low", "medium", "high"],
         "version": "2.2.0",
         "improvements": [
@@ -508,6 +1835,14 @@ async def health_check():
         ]
     }
 
+@app.get("/metrics")
+async def prometheus_metrics():
+    report = memory_report()
+    for kind in ("rss", "pss", "shared", "unique"):
+        if f"{kind}_mb" in report:
+            metrics.PROCESS_MEMORY.labels(kind).set(report[f"{kind}_mb"] * 1024 * 1024)
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE_LATEST)
+
 @app.get("/")
 async def root():
     return {
@@ -522,7 +1857,14 @@ async def root():
         ],
         "endpoints": {
             "/summarize": "POST - Generate complete text summaries",
+            "/summarize/stream": "POST - Stream per-chunk summaries as Server-Sent Events",
             "/health": "GET - Health check",
+            "/health/live": "GET - Liveness probe",
+            "/health/ready": "GET - Readiness probe with per-model load state",
+            "/jobs": "POST - Submit a bulk summarization job (JSON or NDJSON)",
+            "/jobs/{job_id}": "GET - Job progress, DELETE - Cancel a job",
+            "/jobs/{job_id}/results": "GET - Finished documents after a sequence cursor",
+            "/metrics": "GET - Prometheus metrics with per-stage latency histograms",
             "/docs": "GET - API documentation"
         },
         "recommendation": "Use detail_level='high' for maximum completeness"
@@ -0,0 +1,150 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BatchKey = Tuple[str, bool, Tuple[Tuple[str, object], ...]]
+BatchRunner = Callable[[str, list, dict], List[str]]
+
+
+class _Job:
+    __slots__ = ("model_input", "future", "enqueued_at")
+
+    def __init__(self, model_input):
+        self.model_input = model_input
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class BatchScheduler:
+    """Collects chunk-generation jobs from concurrent requests and runs them as padded batches.
+
+    Jobs are grouped by model key, input kind (text or token ids) and generation kwargs;
+    a group is dispatched once it reaches ``max_batch_size`` or its oldest job has waited
+    ``max_wait_ms``.
+    """
+
+    def __init__(self, runner: BatchRunner, max_batch_size: int = 8, max_wait_ms: float = 15.0, workers: int = 1):
+        self._runner = runner
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.workers = max(1, workers)
+        self._cond = threading.Condition()
+        self._groups: Dict[BatchKey, List[_Job]] = {}
+        self._threads: List[threading.Thread] = []
+        self._running = False
+        self._batches_run = 0
+        self._jobs_run = 0
+
+    @staticmethod
+    def make_key(model_key: str, model_input, gen_kwargs: dict) -> BatchKey:
+        return model_key, isinstance(model_input, str), tuple(sorted(gen_kwargs.items()))
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"batch-scheduler-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Batch scheduler started: max_batch_size={self.max_batch_size}, max_wait_ms={self.max_wait * 1000:.0f}, workers={self.workers}")
+
+    def shutdown(self, wait: bool = True):
+        with self._cond:
+            self._running = False
+            pending = [job for jobs in self._groups.values() for job in jobs]
+            self._groups.clear()
+            self._cond.notify_all()
+        for job in pending:
+            job.future.cancel()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []
+
+    def submit(self, model_key: str, model_input, **gen_kwargs) -> Future:
+        job = _Job(model_input)
+        key = self.make_key(model_key, model_input, gen_kwargs)
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("Batch scheduler is not running")
+            self._groups.setdefault(key, []).append(job)
+            self._cond.notify()
+        return job.future
+
+    def pending(self) -> int:
+        with self._cond:
+            return sum(len(jobs) for jobs in self._groups.values())
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "pending_jobs": sum(len(jobs) for jobs in self._groups.values()),
+                "pending_groups": len(self._groups),
+                "batches_run": self._batches_run,
+                "jobs_run": self._jobs_run,
+                "avg_batch_size": round(self._jobs_run / self._batches_run, 2) if self._batches_run else 0.0,
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+            }
+
+    def _take_ready_batch(self) -> Tuple[Optional[BatchKey], List[_Job], Optional[float]]:
+        now = time.monotonic()
+        oldest_key = None
+        oldest_at = None
+        for key, jobs in self._groups.items():
+            if len(jobs) >= self.max_batch_size:
+                return key, self._pop(key), None
+            if oldest_at is None or jobs[0].enqueued_at < oldest_at:
+                oldest_key, oldest_at = key, jobs[0].enqueued_at
+        if oldest_key is None:
+            return None, [], None
+        remaining = oldest_at + self.max_wait - now
+        if remaining <= 0:
+            return oldest_key, self._pop(oldest_key), None
+        return None, [], remaining
+
+    def _pop(self, key: BatchKey) -> List[_Job]:
+        jobs = self._groups[key]
+        batch, rest = jobs[:self.max_batch_size], jobs[self.max_batch_size:]
+        if rest:
+            self._groups[key] = rest
+        else:
+            del self._groups[key]
+        return batch
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._running:
+                        return
+                    key, batch, timeout = self._take_ready_batch()
+                    if batch:
+                        break
+                    self._cond.wait(timeout)
+            batch = [job for job in batch if job.future.set_running_or_notify_cancel()]
+            if batch:
+                self._run(key, batch)
+
+    def _run(self, key: BatchKey, batch: List[_Job]):
+        model_key, _, kwargs = key
+        try:
+            results = self._runner(model_key, [job.model_input for job in batch], dict(kwargs))
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch runner returned {len(results)} results for {len(batch)} inputs")
+        except Exception as e:
+            logger.error(f"Batch of {len(batch)} failed for model={model_key}: {e}")
+            for job in batch:
+                job.future.set_exception(e)
+            return
+        with self._cond:
+            self._batches_run += 1
+            self._jobs_run += len(batch)
+        for job, result in zip(batch, results):
+            job.future.set_result(result)
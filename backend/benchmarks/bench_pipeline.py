@@ -0,0 +1,239 @@
+"""Reproducible benchmark for the summarization pipeline.
+
+Measures per-stage time (clean, params, chunk, run_summarization, format) for every corpus
+document crossed with each detail_level and format, then end-to-end latency percentiles and
+throughput against the FastAPI app at several concurrency levels. ``--stub`` swaps the models
+for a deterministic stub so the non-model overhead can be benchmarked without weights.
+Caches and job state go to a temporary CONTENTSNAP_DATA_DIR unless one is set, so a run
+never leaves benchmark summaries behind for a real server.
+
+    python benchmarks/bench_pipeline.py --stub --concurrency 1,4,16 --output results.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import socket
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from common import latency_summary, load_corpus
+from synthetic import length_bucket, synthetic_corpus
+
+DETAIL_LEVELS = ("low", "medium", "high")
+FORMATS = ("bullet_points", "tldr", "simplified", "detailed")
+STAGES = ("clean", "params", "chunk", "summarize", "format", "total")
+
+
+def configure_environment(args):
+    os.environ.setdefault("CONTENTSNAP_DATA_DIR", tempfile.mkdtemp(prefix="contentsnap-bench-"))
+    if args.stub:
+        os.environ["CONTENTSNAP_MODEL_BACKENDS"] = "bart=stub,t5=stub"
+        os.environ["CONTENTSNAP_STUB_DELAY_MS"] = str(args.stub_delay_ms)
+    if not args.with_cache:
+        os.environ["CONTENTSNAP_CACHE"] = "0"
+        os.environ["CONTENTSNAP_CHUNK_CACHE"] = "0"
+    os.environ["CONTENTSNAP_PRELOAD_MODELS"] = "bart,t5"
+
+
+def build_corpus(args) -> dict:
+    corpus = {} if args.synthetic_only else load_corpus()
+    corpus.update(synthetic_corpus(seed=args.seed))
+    return corpus
+
+
+def bench_stages(app_module, corpus: dict, repeat: int) -> list:
+    for model_key in ("bart", "t5"):
+        app_module.load_model(model_key)
+
+    records = []
+    for name, text in corpus.items():
+        for detail_level in DETAIL_LEVELS:
+            for format_type in FORMATS:
+                timings = {stage: [] for stage in STAGES}
+                chunk_count = 0
+                text_length = 0
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    cleaned = app_module.clean_text(text)
+                    after_clean = time.perf_counter()
+
+                    text_length = len(cleaned)
+                    request = app_module.SummarizeRequest(text=text, format=format_type, detail_level=detail_level, use_cache=False)
+                    min_tokens, max_tokens = app_module.resolve_token_limits(request, text_length)
+                    model_key = app_module.select_model_key(text_length, format_type)
+                    after_params = time.perf_counter()
+
+                    chunks = app_module.chunk_for_model(cleaned, model_key)[0] if text_length > 2000 else [cleaned]
+                    chunk_count = len(chunks)
+                    after_chunk = time.perf_counter()
+
+                    summary, _ = app_module.run_summarization(cleaned, model_key, max_tokens, min_tokens, detail_level)
+                    after_summarize = time.perf_counter()
+
+                    app_module.format_summary(summary or "", format_type, text_length)
+                    finished = time.perf_counter()
+
+                    for stage, (a, b) in zip(STAGES, (
+                        (started, after_clean),
+                        (after_clean, after_params),
+                        (after_params, after_chunk),
+                        (after_chunk, after_summarize),
+                        (after_summarize, finished),
+                        (started, finished),
+                    )):
+                        timings[stage].append((b - a) * 1000)
+
+                records.append({
+                    "document": name,
+                    "length_bucket": length_bucket(text_length),
+                    "original_chars": len(text),
+                    "cleaned_chars": text_length,
+                    "detail_level": detail_level,
+                    "format": format_type,
+                    "chunks": chunk_count,
+                    "stages": {stage: latency_summary(values) for stage, values in timings.items()},
+                })
+    return records
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _post(url: str, payload: dict, timeout: float) -> int:
+    request = urllib.request.Request(url, data=json.dumps(payload).encode("utf-8"), headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def _wait_ready(base_url: str, timeout: float):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/health/ready", timeout=5) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(0.2)
+    raise TimeoutError("Server did not become ready")
+
+
+def bench_end_to_end(app_module, corpus: dict, concurrency_levels: list, requests_per_level: int, timeout: float) -> list:
+    import uvicorn
+
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = uvicorn.Server(uvicorn.Config(app_module.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    workload = [
+        {"text": text, "detail_level": detail_level, "format": format_type, "use_cache": False}
+        for text in corpus.values()
+        for detail_level in DETAIL_LEVELS
+        for format_type in FORMATS
+    ]
+
+    results = []
+    try:
+        _wait_ready(base_url, timeout)
+        for concurrency in concurrency_levels:
+            payloads = [workload[i % len(workload)] for i in range(requests_per_level)]
+            latencies = []
+            statuses = {}
+            lock = threading.Lock()
+
+            def send(payload):
+                started = time.perf_counter()
+                status = _post(f"{base_url}/summarize", payload, timeout)
+                elapsed = (time.perf_counter() - started) * 1000
+                with lock:
+                    latencies.append(elapsed)
+                    statuses[status] = statuses.get(status, 0) + 1
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                list(pool.map(send, payloads))
+            wall = time.perf_counter() - started
+
+            results.append({
+                "concurrency": concurrency,
+                "requests": len(payloads),
+                "statuses": {str(k): v for k, v in sorted(statuses.items())},
+                "latency": latency_summary(latencies),
+                "throughput_rps": round(len(payloads) / wall, 3),
+                "throughput_chars_per_s": round(sum(len(p["text"]) for p in payloads) / wall, 1),
+            })
+    finally:
+        server.should_exit = True
+        thread.join(timeout)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stub", action="store_true", help="Use the deterministic stub summarizer instead of real models")
+    parser.add_argument("--stub-delay-ms", type=float, default=0.0, help="Fixed delay per stub generation batch")
+    parser.add_argument("--with-cache", action="store_true", help="Leave the summary and chunk caches enabled")
+    parser.add_argument("--synthetic-only", action="store_true", help="Skip the fixture corpus")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per stage benchmark case")
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma separated concurrency levels for the end-to-end run")
+    parser.add_argument("--requests", type=int, default=48, help="Requests per concurrency level")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--skip-stages", action="store_true")
+    parser.add_argument("--skip-e2e", action="store_true")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    configure_environment(args)
+    logging.disable(logging.INFO)
+
+    import app as app_module
+
+    corpus = build_corpus(args)
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "stub": args.stub,
+            "stub_delay_ms": args.stub_delay_ms,
+            "with_cache": args.with_cache,
+            "data_dir": os.environ["CONTENTSNAP_DATA_DIR"],
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "documents": {name: len(text) for name, text in corpus.items()},
+        },
+    }
+    if not args.skip_stages:
+        report["stages"] = bench_stages(app_module, corpus, args.repeat)
+    if not args.skip_e2e:
+        levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+        report["end_to_end"] = bench_end_to_end(app_module, corpus, levels, args.requests, args.timeout)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Micro-benchmarks for text preprocessing: the single-pass engine against the functions it replaced.
+
+For every corpus document this times normalization, sentence segmentation, streaming
+normalization of the body in upload-sized pieces, and the preprocessing a /summarize request
+does end to end (clean, prefilter split, chunker split). Each case checks that both
+implementations produce the same text before timing them, and reports the memory of the
+sentence index against a list of sentence strings.
+
+    python benchmarks/bench_preprocess.py --repeat 20 --output preprocess.json
+"""
+import argparse
+import json
+import re
+import sys
+import time
+import unicodedata
+
+from common import latency_summary, load_corpus
+from synthetic import synthetic_corpus, synthetic_document
+
+from extractive import split_sentences
+from preprocess import Document, StreamNormalizer, normalize_text, preprocess_text
+
+UPLOAD_PIECE_CHARS = 65536
+
+
+def legacy_clean_text(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text)
+
+    char_replacements = {
+        '"': '"', '"': '"',
+        ''': "'", ''': "'",
+        '–': '-', '—': '-',
+        '…': '...',
+        '★': '*',
+        '🎬': '[Movie]',
+        '💖': '[Heart]',
+    }
+
+    for old_char, new_char in char_replacements.items():
+        text = text.replace(old_char, new_char)
+
+    text = re.sub(r'[^\w\s.,!?;:\-()"\'\[\]*/]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def legacy_clean_piece(piece: str) -> str:
+    cleaned = legacy_clean_text(piece)
+    leading = " " if piece[:1].isspace() else ""
+    trailing = " " if piece[-1:].isspace() else ""
+    return f"{leading}{cleaned}{trailing}" if cleaned else leading or trailing
+
+
+def legacy_segment(text: str) -> list:
+    return re.split(r'(?<=[.!?])\s+', text)
+
+
+def legacy_stream(text: str) -> str:
+    return "".join(legacy_clean_piece(text[i:i + UPLOAD_PIECE_CHARS]) for i in range(0, len(text), UPLOAD_PIECE_CHARS))
+
+
+def new_stream(text: str) -> str:
+    normalizer = StreamNormalizer()
+    return "".join(normalizer.feed(text[i:i + UPLOAD_PIECE_CHARS]) for i in range(0, len(text), UPLOAD_PIECE_CHARS))
+
+
+def legacy_request(text: str) -> int:
+    cleaned = legacy_clean_text(text)
+    prefilter = split_sentences(cleaned)
+    chunker = [s.strip() for s in legacy_segment(cleaned)]
+    return len(prefilter) + len(chunker)
+
+
+def new_request(text: str) -> int:
+    document = preprocess_text(text)
+    return len(document.sentences()) + len([s.strip() for s in document.sentences()])
+
+
+def time_ms(fn, arg, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def index_bytes(document: Document) -> int:
+    return sum(sys.getsizeof(column) for column in (document.paragraph_starts, document.sentence_starts, document.sentence_ends))
+
+
+def bench_document(text: str, repeat: int) -> dict:
+    cleaned = legacy_clean_text(text)
+    if normalize_text(text) != cleaned or preprocess_text(text).text != cleaned or new_stream(text) != cleaned:
+        raise AssertionError("preprocess output differs from the legacy functions")
+    document = Document(cleaned)
+    if document.sentences() != legacy_segment(cleaned):
+        raise AssertionError("sentence index differs from re.split")
+
+    cases = {
+        "clean": (legacy_clean_text, normalize_text, text),
+        "clean_and_index": (legacy_clean_text, preprocess_text, text),
+        "segment": (legacy_segment, Document, cleaned),
+        "stream": (legacy_stream, new_stream, text),
+        "request": (legacy_request, new_request, text),
+    }
+    results = {}
+    for name, (legacy, new, arg) in cases.items():
+        legacy_ms = latency_summary(time_ms(legacy, arg, repeat))
+        new_ms = latency_summary(time_ms(new, arg, repeat))
+        results[name] = {
+            "legacy": legacy_ms,
+            "new": new_ms,
+            "speedup_p50": round(legacy_ms["p50_ms"] / max(new_ms["p50_ms"], 1e-6), 2),
+        }
+    sentences = legacy_segment(cleaned)
+    results["memory"] = {
+        "sentences": len(sentences),
+        "sentence_list_bytes": sys.getsizeof(sentences) + sum(sys.getsizeof(s) for s in sentences),
+        "index_bytes": index_bytes(document),
+    }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--large-chars", type=int, default=2_000_000, help="Size of the extra upload-sized synthetic document")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    corpus.update(synthetic_corpus(seed=args.seed))
+    if args.large_chars:
+        corpus["synthetic_upload"] = synthetic_document(args.large_chars, args.seed)
+
+    report = {"repeat": args.repeat, "piece_chars": UPLOAD_PIECE_CHARS, "documents": {}}
+    for name, text in corpus.items():
+        print(f"Benchmarking {name} ({len(text)} chars)...", file=sys.stderr)
+        report["documents"][name] = {"chars": len(text), **bench_document(text, args.repeat)}
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
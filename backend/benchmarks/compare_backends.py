@@ -0,0 +1,116 @@
+"""Compare inference backends for one model on the local corpus.
+
+Each backend runs in a fresh subprocess so load time and RSS are measured in isolation.
+ROUGE drift is computed against the fp32 torch outputs.
+
+    python benchmarks/compare_backends.py --model bart --backends torch,int8,onnx
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+from common import latency_summary, load_corpus, rouge, rss_bytes
+
+GEN_KWARGS = {
+    "max_length": 130,
+    "min_length": 40,
+    "do_sample": False,
+    "truncation": True,
+    "early_stopping": True,
+    "num_beams": 4,
+}
+
+
+def run_worker(model_key: str, backend: str, repeat: int):
+    from models import build_pipeline, run_batch
+
+    corpus = load_corpus()
+    rss_start = rss_bytes()
+    started = time.perf_counter()
+    summarizer = build_pipeline(model_key, backend=backend, fallback=False)
+    load_s = time.perf_counter() - started
+    rss_loaded = rss_bytes()
+
+    run_batch(summarizer, [next(iter(corpus.values()))], GEN_KWARGS)
+
+    latencies = []
+    outputs = {}
+    for _ in range(repeat):
+        for name, text in corpus.items():
+            started = time.perf_counter()
+            outputs[name] = run_batch(summarizer, [text], GEN_KWARGS)[0]
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    json.dump({
+        "backend": backend,
+        "load_s": round(load_s, 3),
+        "rss_model_mb": round((rss_loaded - rss_start) / 2 ** 20, 1),
+        "rss_after_run_mb": round(rss_bytes() / 2 ** 20, 1),
+        "latency": latency_summary(latencies),
+        "outputs": outputs,
+    }, sys.stdout)
+
+
+def compare(model_key: str, backends: list, repeat: int) -> dict:
+    if "torch" not in backends:
+        backends = ["torch"] + backends
+
+    runs = {}
+    for backend in backends:
+        print(f"Running {model_key} on {backend}...", file=sys.stderr)
+        proc = subprocess.run(
+            [sys.executable, __file__, "--worker", "--model", model_key, "--backend", backend, "--repeat", str(repeat)],
+            capture_output=True,
+            text=True
+        )
+        if proc.returncode != 0:
+            runs[backend] = {"backend": backend, "error": proc.stderr.strip().splitlines()[-1:]}
+            continue
+        runs[backend] = json.loads(proc.stdout)
+
+    baseline = runs.get("torch", {})
+    for backend, run in runs.items():
+        if "error" in run or "error" in baseline:
+            continue
+        drift = {}
+        for name, output in run["outputs"].items():
+            drift[name] = rouge(output, baseline["outputs"][name])
+        run["rouge_vs_fp32"] = drift
+        run["rouge_vs_fp32_mean"] = {
+            metric: round(sum(scores[metric] for scores in drift.values()) / len(drift), 4)
+            for metric in ("rouge1", "rouge2", "rougeL")
+        }
+        run["speedup_p50"] = round(baseline["latency"]["p50_ms"] / run["latency"]["p50_ms"], 3) if run["latency"]["p50_ms"] else None
+
+    return {"model": model_key, "repeat": repeat, "gen_kwargs": GEN_KWARGS, "backends": runs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="bart")
+    parser.add_argument("--backends", default="torch,int8,onnx")
+    parser.add_argument("--backend", help=argparse.SUPPRESS)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.model, args.backend, args.repeat)
+        return
+
+    report = compare(args.model, [b.strip() for b in args.backends.split(",") if b.strip()], args.repeat)
+    for run in report["backends"].values():
+        run.pop("outputs", None)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compare two bench_pipeline.py reports and flag regressions.
+
+    python benchmarks/compare_results.py baseline.json current.json --threshold 0.10
+
+Exits with status 1 when any stage p50 or end-to-end p95 got slower, or any throughput got
+lower, by more than the threshold.
+"""
+import argparse
+import json
+import sys
+
+
+def _stage_index(report: dict) -> dict:
+    index = {}
+    for record in report.get("stages", []):
+        for stage, summary in record["stages"].items():
+            index[(record["document"], record["detail_level"], record["format"], stage)] = summary["p50_ms"]
+    return index
+
+
+def _relative(baseline: float, current: float) -> float:
+    return (current - baseline) / baseline if baseline else 0.0
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_ms: float) -> list:
+    findings = []
+
+    base_stages, cur_stages = _stage_index(baseline), _stage_index(current)
+    for key, base_p50 in base_stages.items():
+        cur_p50 = cur_stages.get(key)
+        if cur_p50 is None or max(base_p50, cur_p50) < min_ms:
+            continue
+        change = _relative(base_p50, cur_p50)
+        if change > threshold:
+            findings.append({"kind": "stage_p50", "case": "/".join(key), "baseline_ms": base_p50, "current_ms": cur_p50, "change": round(change, 4)})
+
+    base_e2e = {run["concurrency"]: run for run in baseline.get("end_to_end", [])}
+    for run in current.get("end_to_end", []):
+        base = base_e2e.get(run["concurrency"])
+        if base is None:
+            continue
+        change = _relative(base["latency"]["p95_ms"], run["latency"]["p95_ms"])
+        if change > threshold:
+            findings.append({"kind": "e2e_p95", "case": f"concurrency={run['concurrency']}", "baseline_ms": base["latency"]["p95_ms"], "current_ms": run["latency"]["p95_ms"], "change": round(change, 4)})
+        change = -_relative(base["throughput_rps"], run["throughput_rps"])
+        if change > threshold:
+            findings.append({"kind": "throughput", "case": f"concurrency={run['concurrency']}", "baseline_rps": base["throughput_rps"], "current_rps": run["throughput_rps"], "change": round(-change, 4)})
+
+    return findings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown")
+    parser.add_argument("--min-ms", type=float, default=1.0, help="Ignore stage timings below this many milliseconds")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    findings = compare(baseline, current, args.threshold, args.min_ms)
+    print(json.dumps({"threshold": args.threshold, "regressions": findings}, indent=2))
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
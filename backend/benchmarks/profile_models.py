@@ -0,0 +1,122 @@
+"""Measure the cost profile of each routable model on the local corpus.
+
+Each model runs in a fresh subprocess. The report gives milliseconds per 1k input tokens
+(the unit the router estimates latency in), load time, RSS and ROUGE against bart-large, and
+is written where the server reads it with CONTENTSNAP_ROUTER=1.
+
+    python benchmarks/profile_models.py --models bart,distilbart,t5,t5_small
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from common import latency_summary, load_corpus, rouge, rss_bytes
+
+GEN_KWARGS = {
+    "max_length": 130,
+    "min_length": 40,
+    "do_sample": False,
+    "truncation": True,
+    "early_stopping": True,
+    "num_beams": 4,
+}
+
+
+def run_worker(model_key: str, repeat: int):
+    from models import MODEL_PREFIXES, build_pipeline, run_batch
+
+    corpus = load_corpus()
+    rss_start = rss_bytes()
+    started = time.perf_counter()
+    summarizer = build_pipeline(model_key, fallback=False)
+    load_s = time.perf_counter() - started
+    rss_loaded = rss_bytes()
+    # The pipeline prepends the model's prefix to string inputs itself, so it is only added
+    # here to count the tokens the model actually reads.
+    prefix = MODEL_PREFIXES.get(model_key, "")
+
+    run_batch(summarizer, [next(iter(corpus.values()))], GEN_KWARGS)
+
+    latencies = []
+    total_ms = 0.0
+    total_tokens = 0
+    outputs = {}
+    for _ in range(repeat):
+        for name, text in corpus.items():
+            tokens = min(len(summarizer.tokenizer(prefix + text)["input_ids"]), summarizer.tokenizer.model_max_length)
+            started = time.perf_counter()
+            outputs[name] = run_batch(summarizer, [text], GEN_KWARGS)[0]
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            latencies.append(elapsed_ms)
+            total_ms += elapsed_ms
+            total_tokens += tokens
+
+    json.dump({
+        "model": model_key,
+        "load_s": round(load_s, 3),
+        "rss_model_mb": round((rss_loaded - rss_start) / 2 ** 20, 1),
+        "ms_per_1k_tokens": round(total_ms / max(total_tokens, 1) * 1000, 1),
+        "latency": latency_summary(latencies),
+        "outputs": outputs,
+    }, sys.stdout)
+
+
+def profile(models: list, repeat: int) -> dict:
+    runs = {}
+    for model_key in models:
+        print(f"Profiling {model_key}...", file=sys.stderr)
+        proc = subprocess.run(
+            [sys.executable, __file__, "--worker", "--model", model_key, "--repeat", str(repeat)],
+            capture_output=True,
+            text=True
+        )
+        if proc.returncode != 0:
+            runs[model_key] = {"model": model_key, "error": proc.stderr.strip().splitlines()[-1:]}
+            continue
+        runs[model_key] = json.loads(proc.stdout)
+
+    baseline = runs.get("bart", {})
+    for model_key, run in runs.items():
+        if "error" in run or "outputs" not in baseline:
+            continue
+        scores = [rouge(output, baseline["outputs"][name]) for name, output in run["outputs"].items()]
+        run["rouge_vs_bart_mean"] = {
+            metric: round(sum(score[metric] for score in scores) / len(scores), 4)
+            for metric in ("rouge1", "rouge2", "rougeL")
+        }
+
+    return {"repeat": repeat, "gen_kwargs": GEN_KWARGS, "models": runs}
+
+
+def main():
+    import settings
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", default="bart,distilbart,t5,t5_small")
+    parser.add_argument("--model", help=argparse.SUPPRESS)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--output", default=settings.ROUTER_PROFILES_PATH, help="Where to write the JSON report")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.model, args.repeat)
+        return
+
+    models = [m.strip() for m in args.models.split(",") if m.strip()]
+    if "bart" not in models:
+        models = ["bart"] + models
+    report = profile(models, args.repeat)
+    for run in report["models"].values():
+        run.pop("outputs", None)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        f.write(json.dumps(report, indent=2) + "\n")
+    print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
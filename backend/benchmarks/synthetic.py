@@ -0,0 +1,54 @@
+import random
+from typing import Dict
+
+LENGTH_BUCKETS: Dict[str, int] = {
+    "short": 1500,
+    "medium": 6000,
+    "long": 25000,
+    "very_long": 80000,
+}
+
+_WORDS = (
+    "the council report market energy research team city data study network users model "
+    "system results policy growth company price quarter analysts workers project water "
+    "climate school health plan budget region transport service security software update "
+    "measured increased reduced announced expected reported suggested improved delayed "
+    "because although however meanwhile while after before during across within between "
+    "significant early final local national public private recent major minor annual"
+).split()
+
+_DECORATIONS = ("“quoted”", "‘note’", "–", "—", "…", "★", "\U0001f3ac")
+
+
+def synthetic_document(target_chars: int, seed: int = 0) -> str:
+    rng = random.Random(seed * 1000003 + target_chars)
+    paragraphs = []
+    length = 0
+    while length < target_chars:
+        sentences = []
+        for _ in range(rng.randint(3, 7)):
+            words = [rng.choice(_WORDS) for _ in range(rng.randint(8, 28))]
+            if rng.random() < 0.15:
+                words.insert(rng.randrange(len(words)), rng.choice(_DECORATIONS))
+            if rng.random() < 0.3:
+                words.insert(rng.randrange(1, len(words)), f"{rng.randint(2, 999)}")
+            sentence = " ".join(words)
+            sentences.append(sentence[0].upper() + sentence[1:] + rng.choice(".....!?"))
+        paragraph = " ".join(sentences)
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return "\n\n".join(paragraphs)[:target_chars].rsplit(" ", 1)[0] + "."
+
+
+def synthetic_corpus(seed: int = 0) -> Dict[str, str]:
+    return {f"synthetic_{bucket}": synthetic_document(size, seed) for bucket, size in LENGTH_BUCKETS.items()}
+
+
+def length_bucket(text_length: int) -> str:
+    if text_length > 50000:
+        return ">50000"
+    if text_length > 10000:
+        return "10000-50000"
+    if text_length > 2000:
+        return "2000-10000"
+    return "<2000"
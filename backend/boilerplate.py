@@ -0,0 +1,272 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_WORDS = 3
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_rng = np.random.RandomState(1729)
+_PERM_A = _rng.randint(1, 1 << 29, size=NUM_PERMUTATIONS).astype(np.uint64)
+_PERM_B = _rng.randint(0, 1 << 29, size=NUM_PERMUTATIONS).astype(np.uint64)
+
+SHORT_LINE_WORDS = 4
+SHORT_LINE_RUN = 3
+LINK_DENSITY_LIMIT = 0.5
+BOILERPLATE_MAX_WORDS = 30
+BOILERPLATE_PHRASE_DENSITY = 0.5
+SITE_MATCH_BANDS = 4
+TRIM_EVERY_DOCUMENTS = 200
+
+WORD = re.compile(r"\w+")
+LINE = re.compile(r"\S(?:[^\r\n]*\S)?")
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+LINK = re.compile(r"\[[^\]]*\]\([^)]*\)|https?://\S+|www\.\S+")
+BOILERPLATE_PHRASES = re.compile(
+    r"\b(cookies?|consent|subscribe|newsletter|sign (?:up|in)|log ?in|all rights reserved|privacy policy|"
+    r"terms of (?:use|service)|share (?:this|on)|follow us|advertisement|related (?:articles|posts|stories)|"
+    r"read more|skip to (?:main )?content|accept all)\b",
+    re.IGNORECASE
+)
+# Lowercase words that still fit a title-cased menu label such as "About us" or "Terms of Use".
+MENU_CONNECTORS = frozenset({"a", "and", "at", "for", "in", "of", "on", "the", "to", "us", "with"})
+
+
+def site_of(url: Optional[str]) -> Optional[str]:
+    if not url:
+        return None
+    host = urlsplit(url if "//" in url else f"//{url}").hostname
+    if not host:
+        return None
+    return host[4:] if host.startswith("www.") else host
+
+
+def split_blocks(text: str) -> Tuple[List[str], List[str], str]:
+    """Split raw page text into lines, or sentences when the text arrives already flattened.
+
+    Also returns the original whitespace in front of each block, so the blocks that are kept
+    can be rejoined without losing the paragraph breaks between them.
+    """
+    spans = [match.span() for match in LINE.finditer(text)]
+    mode = "lines"
+    if len(spans) < 3:
+        mode = "sentences"
+        spans = []
+        bounds = [0] + [offset for match in SENTENCE_SPLIT.finditer(text) for offset in match.span()] + [len(text)]
+        for start, end in zip(bounds[::2], bounds[1::2]):
+            segment = text[start:end]
+            stripped = segment.strip()
+            if stripped:
+                offset = start + len(segment) - len(segment.lstrip())
+                spans.append((offset, offset + len(stripped)))
+    blocks = [text[start:end] for start, end in spans]
+    gaps = [text[previous_end:start] for previous_end, (start, _) in zip([0] + [end for _, end in spans], spans)]
+    return blocks, gaps, mode
+
+
+def minhash_signature(block: str) -> Optional[np.ndarray]:
+    words = WORD.findall(block.lower())
+    if not words:
+        return None
+    if len(words) < SHINGLE_WORDS:
+        shingles = {" ".join(words)}
+    else:
+        shingles = {" ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+    hashes = np.fromiter((zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64, count=len(shingles))
+    return ((_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) % _MERSENNE_PRIME).min(axis=1)
+
+
+def band_keys(signature: np.ndarray) -> List[int]:
+    bands = signature.reshape(BANDS, ROWS_PER_BAND)
+    return [(band << 32) | zlib.crc32(bands[band].tobytes()) for band in range(BANDS)]
+
+
+class FingerprintStore:
+    """Per-site counts of how many distinct documents contained each MinHash band."""
+
+    def __init__(self, db_path: str, max_entries: int = 1000000):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._recorded = 0
+        self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS site_blocks ("
+            "site TEXT NOT NULL, band INTEGER NOT NULL, documents INTEGER NOT NULL, last_seen REAL NOT NULL, "
+            "PRIMARY KEY (site, band))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS site_blocks_seen ON site_blocks(last_seen)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS site_documents (site TEXT NOT NULL, digest TEXT NOT NULL, PRIMARY KEY (site, digest))"
+        )
+
+    def band_counts(self, site: str, bands: List[int]) -> Dict[int, int]:
+        if not bands:
+            return {}
+        counts = {}
+        with self._lock:
+            for start in range(0, len(bands), 500):
+                batch = bands[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                counts.update(self._db.execute(
+                    f"SELECT band, documents FROM site_blocks WHERE site = ? AND band IN ({placeholders})",
+                    (site, *batch)
+                ).fetchall())
+        return counts
+
+    def record(self, site: str, digest: str, bands: List[int]):
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN")
+            seen = self._db.execute("INSERT OR IGNORE INTO site_documents (site, digest) VALUES (?, ?)", (site, digest)).rowcount == 0
+            if not seen:
+                self._db.executemany(
+                    "INSERT INTO site_blocks (site, band, documents, last_seen) VALUES (?, ?, 1, ?) "
+                    "ON CONFLICT(site, band) DO UPDATE SET documents = documents + 1, last_seen = excluded.last_seen",
+                    [(site, band, now) for band in set(bands)]
+                )
+            self._db.execute("COMMIT")
+            self._recorded += 1
+            if self._recorded % TRIM_EVERY_DOCUMENTS == 0:
+                self._trim()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "sites": self._db.execute("SELECT COUNT(DISTINCT site) FROM site_documents").fetchone()[0],
+                "documents": self._db.execute("SELECT COUNT(*) FROM site_documents").fetchone()[0],
+                "bands": self._db.execute("SELECT COUNT(*) FROM site_blocks").fetchone()[0],
+            }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _trim(self):
+        excess = self._db.execute("SELECT COUNT(*) FROM site_blocks").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM site_blocks WHERE rowid IN (SELECT rowid FROM site_blocks ORDER BY last_seen LIMIT ?)",
+                (excess,)
+            )
+
+
+class BoilerplateFilter:
+    """Drops navigation, banners, link lists and repeated blocks from raw page text.
+
+    Blocks are lines (or sentences for flattened text). A block is removed when it is a
+    near-duplicate of an earlier block (MinHash LSH at ``similarity``), is link-dense, is part
+    of a run of menu labels, is a short unpunctuated block dominated by banner phrasing, or, given
+    a site, shares enough MinHash bands with blocks already seen in ``site_repeat_threshold``
+    other documents from that site.
+    """
+
+    def __init__(self, store: Optional[FingerprintStore] = None, similarity: float = 0.8, site_repeat_threshold: int = 3):
+        self.store = store
+        self.similarity = similarity
+        self.site_repeat_threshold = site_repeat_threshold
+
+    def filter(self, text: str, site: Optional[str] = None) -> Tuple[str, dict]:
+        blocks, gaps, mode = split_blocks(text)
+        removed = {"duplicate": 0, "link_dense": 0, "short_lines": 0, "boilerplate": 0, "site_repeat": 0}
+        keep = [True] * len(blocks)
+
+        if mode == "lines":
+            self._drop_short_runs(blocks, keep, removed)
+
+        signatures = [minhash_signature(block) for block in blocks]
+        all_bands = [band_keys(signature) if signature is not None else [] for signature in signatures]
+        site_counts = self.store.band_counts(site, sorted({b for bands in all_bands for b in bands})) if site and self.store else {}
+
+        seen_bands: Dict[int, List[int]] = {}
+        for i, block in enumerate(blocks):
+            if not keep[i]:
+                continue
+            reason = self._block_reason(block)
+            if reason is None and signatures[i] is not None:
+                if self._is_near_duplicate(signatures, all_bands[i], seen_bands, i):
+                    reason = "duplicate"
+                elif site_counts and len(WORD.findall(block)) >= SHORT_LINE_WORDS and \
+                        sum(site_counts.get(b, 0) >= self.site_repeat_threshold for b in all_bands[i]) >= SITE_MATCH_BANDS:
+                    reason = "site_repeat"
+            if reason is not None:
+                keep[i] = False
+                removed[reason] += 1
+                continue
+            for band in all_bands[i]:
+                seen_bands.setdefault(band, []).append(i)
+
+        pieces = []
+        separator = None
+        for block, gap, kept in zip(blocks, gaps, keep):
+            if separator is None or gap.count("\n") > separator.count("\n"):
+                separator = gap
+            if kept:
+                pieces.extend([separator, block] if pieces else [block])
+                separator = None
+        filtered = "".join(pieces)
+        if site and self.store:
+            digest = hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+            self.store.record(site, digest, [b for bands in all_bands for b in bands])
+
+        return filtered, {
+            "mode": mode,
+            "blocks_total": len(blocks),
+            "blocks_removed": removed,
+            "site": site,
+        }
+
+    def _is_near_duplicate(self, signatures: List[Optional[np.ndarray]], bands: List[int], seen_bands: Dict[int, List[int]], i: int) -> bool:
+        candidates = {j for band in bands for j in seen_bands.get(band, ())}
+        return any(np.mean(signatures[i] == signatures[j]) >= self.similarity for j in candidates)
+
+    @staticmethod
+    def _block_reason(block: str) -> Optional[str]:
+        links = sum(len(match) for match in LINK.findall(block))
+        if links and links / len(block) > LINK_DENSITY_LIMIT:
+            return "link_dense"
+        words = len(WORD.findall(block))
+        if words <= BOILERPLATE_MAX_WORDS and not block.rstrip().endswith((".", "!", "?")):
+            phrase_words = sum(len(WORD.findall(phrase)) for phrase in BOILERPLATE_PHRASES.findall(block))
+            if phrase_words and phrase_words / words >= BOILERPLATE_PHRASE_DENSITY:
+                return "boilerplate"
+        return None
+
+    @staticmethod
+    def _drop_short_runs(blocks: List[str], keep: List[bool], removed: dict):
+        """Drop runs of menu labels: short title-cased lines without digits or punctuation.
+
+        Short lines that read like list items (sentence case, quantities, or a run introduced
+        by a line ending in a colon) are kept, so ingredient and bullet lists survive.
+        """
+        def is_menu_label(line: str) -> bool:
+            if len(WORD.findall(line)) > SHORT_LINE_WORDS or line.endswith((".", "!", "?", ":", '"', ",", ";")):
+                return False
+            if any(char.isdigit() for char in line):
+                return False
+            return all(word[0].isupper() or not word[0].isalpha() or word in MENU_CONNECTORS for word in line.split())
+
+        start = 0
+        while start < len(blocks):
+            if not is_menu_label(blocks[start]):
+                start += 1
+                continue
+            end = start
+            while end < len(blocks) and is_menu_label(blocks[end]):
+                end += 1
+            if end - start >= SHORT_LINE_RUN and not (start and blocks[start - 1].endswith(":")):
+                for i in range(start, end):
+                    keep[i] = False
+                removed["short_lines"] += end - start
+            start = end
@@ -0,0 +1,195 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRIM_EVERY_PUTS = 100
+
+
+def content_key(text: str, **params) -> str:
+    digest = hashlib.sha256()
+    digest.update(json.dumps(params, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """Two-tier result cache: a byte-budgeted in-memory LRU in front of a SQLite store.
+
+    ``get_or_compute`` also collapses concurrent misses for the same key into a single
+    computation that every caller awaits.
+    """
+
+    def __init__(self, max_memory_bytes: int, db_path: Optional[str], ttl_seconds: float, max_disk_entries: int = 100000):
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, Tuple[float, int, dict]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._waiters: Dict[str, int] = {}
+        self._puts = 0
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "dedup_waits": 0,
+            "memory_evictions": 0,
+            "expired": 0,
+            "disk_trimmed": 0,
+        }
+        self._db = None
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS summaries_accessed ON summaries(accessed_at)")
+            self.purge_expired()
+
+    def get(self, key: str) -> Optional[dict]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, size, value = entry
+                if now - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return value
+                self._drop_memory(key)
+                self._stats["expired"] += 1
+
+            if self._db is not None:
+                row = self._db.execute("SELECT value, created_at FROM summaries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    raw, created_at = row
+                    if now - created_at <= self.ttl_seconds:
+                        self._db.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (now, key))
+                        value = json.loads(raw)
+                        self._remember(key, created_at, len(raw), value)
+                        self._stats["disk_hits"] += 1
+                        return value
+                    self._db.execute("DELETE FROM summaries WHERE key = ?", (key,))
+                    self._stats["expired"] += 1
+
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, key: str, value: dict):
+        now = time.time()
+        raw = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            self._remember(key, now, len(raw), value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO summaries (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, raw, now, now)
+                )
+                self._puts += 1
+                if self._puts % TRIM_EVERY_PUTS == 0:
+                    self._trim_disk()
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[dict]], bypass: bool = False) -> Tuple[dict, bool]:
+        if not bypass:
+            value = self.get(key)
+            if value is not None:
+                return value, True
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._stats["dedup_waits"] += 1
+            self._waiters[key] = self._waiters.get(key, 0) + 1
+            try:
+                return await asyncio.shield(pending), False
+            finally:
+                self._waiters[key] -= 1
+                if not self._waiters[key]:
+                    del self._waiters[key]
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+            self.put(key, value)
+            future.set_result(value)
+            return value, False
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def has_waiters(self, key: str) -> bool:
+        return self._waiters.get(key, 0) > 0
+
+    def purge_expired(self):
+        if self._db is None:
+            return
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            deleted = self._db.execute("DELETE FROM summaries WHERE created_at < ?", (cutoff,)).rowcount
+            self._stats["expired"] += max(0, deleted)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["memory_bytes"] = self._memory_bytes
+            stats["max_memory_bytes"] = self.max_memory_bytes
+            stats["inflight"] = len(self._inflight)
+            if self._db is not None:
+                stats["disk_entries"] = self._db.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def close(self):
+        if self._db is not None:
+            with self._lock:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, created_at: float, size: int, value: dict):
+        if key in self._memory:
+            self._drop_memory(key)
+        if size > self.max_memory_bytes:
+            return
+        self._memory[key] = (created_at, size, value)
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes:
+            evicted_key = next(iter(self._memory))
+            self._drop_memory(evicted_key)
+            self._stats["memory_evictions"] += 1
+
+    def _drop_memory(self, key: str):
+        _, size, _ = self._memory.pop(key)
+        self._memory_bytes -= size
+
+    def _trim_disk(self):
+        count = self._db.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        excess = count - self.max_disk_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM summaries WHERE key IN (SELECT key FROM summaries ORDER BY accessed_at LIMIT ?)",
+                (excess,)
+            )
+            self._stats["disk_trimmed"] += excess
@@ -0,0 +1,120 @@
+import zlib
+from typing import Callable, Dict
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class _ZlibDecoder:
+    def __init__(self, wbits: int):
+        self._decoder = zlib.decompressobj(wbits)
+
+    def decompress(self, data: bytes, limit: int) -> bytes:
+        return self._decoder.decompress(data, limit)
+
+    def flush(self) -> bytes:
+        if not self._decoder.eof:
+            raise zlib.error("truncated stream")
+        return b""
+
+
+class _ZstdDecoder:
+    # zstd has no output cap per call, but a block inflates to at most 128 KiB from no fewer
+    # than 4 bytes. Feeding input in slices sized to the remaining allowance keeps every
+    # step within the limit plus one block, so a small bomb never inflates in full.
+    MAX_RATIO = 128 * 1024 // 4
+    MIN_STEP = 4
+
+    def __init__(self):
+        self._decoder = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes, limit: int) -> bytes:
+        output = []
+        produced = 0
+        view = memoryview(data)
+        while view and produced < limit:
+            step = max(self.MIN_STEP, (limit - produced) // self.MAX_RATIO)
+            chunk = self._decoder.decompress(view[:step])
+            view = view[step:]
+            output.append(chunk)
+            produced += len(chunk)
+        return b"".join(output)
+
+    def flush(self) -> bytes:
+        if not self._decoder.eof:
+            raise zstandard.ZstdError("truncated frame")
+        return self._decoder.flush()
+
+
+DECODERS: Dict[str, Callable[[], object]] = {
+    "gzip": lambda: _ZlibDecoder(16 + zlib.MAX_WBITS),
+    "x-gzip": lambda: _ZlibDecoder(16 + zlib.MAX_WBITS),
+    "deflate": lambda: _ZlibDecoder(zlib.MAX_WBITS),
+    "zstd": _ZstdDecoder,
+}
+
+
+def supported_encodings() -> list:
+    return [encoding for encoding in DECODERS if encoding != "zstd" or zstandard is not None]
+
+
+class DecompressionMiddleware:
+    """Transparently inflates gzip, deflate and zstd request bodies as they are received.
+
+    Bodies are decoded message by message so streaming endpoints still see the upload
+    incrementally, and decoding stops with 413 once ``max_bytes`` of plain text is exceeded.
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = ""
+        for name, value in scope["headers"]:
+            if name == b"content-encoding":
+                encoding = value.decode("latin-1").strip().lower()
+        if encoding in ("", "identity"):
+            await self.app(scope, receive, send)
+            return
+        if encoding not in supported_encodings():
+            response = JSONResponse(
+                {"detail": f"Unsupported Content-Encoding '{encoding}'. Use one of: {', '.join(supported_encodings())}"},
+                status_code=415
+            )
+            await response(scope, receive, send)
+            return
+
+        decoder = DECODERS[encoding]()
+        received = 0
+        scope = {
+            **scope,
+            "headers": [(name, value) for name, value in scope["headers"] if name not in (b"content-encoding", b"content-length")],
+        }
+
+        async def inflating_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            more_body = message.get("more_body", False)
+            try:
+                body = decoder.decompress(message.get("body", b""), self.max_bytes - received + 1)
+                received += len(body)
+                if received > self.max_bytes:
+                    raise HTTPException(status_code=413, detail=f"Decompressed body exceeds {self.max_bytes} bytes")
+                if not more_body:
+                    body += decoder.flush()
+            except (zlib.error, ValueError, getattr(zstandard, "ZstdError", ValueError)) as e:
+                raise HTTPException(status_code=400, detail=f"Invalid {encoding} request body: {e}")
+            return {"type": "http.request", "body": body, "more_body": more_body}
+
+        await self.app(scope, inflating_receive, send)
@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+DECODING_TIERS: Dict[str, dict] = {
+    "fast": {"num_beams": 1, "max_tokens_scale": 0.6, "length_penalty": 1.0, "repetition_penalty": 1.2, "no_repeat_ngram_size": 3},
+    "balanced": {"num_beams": 2, "max_tokens_scale": 0.8, "length_penalty": 1.1, "repetition_penalty": 1.1},
+    "quality": {"num_beams": 4, "max_tokens_scale": 1.0, "length_penalty": 1.2, "repetition_penalty": 1.1},
+}
+AUTO_TIER = "auto"
+
+
+def apply_tier(gen_kwargs: dict, tier: str, is_last_chunk: bool = False) -> dict:
+    """Return ``gen_kwargs`` with the tier's beam count, penalties and token cap applied."""
+    spec = DECODING_TIERS[tier]
+    kwargs = dict(gen_kwargs)
+    kwargs["max_length"] = max(kwargs.get("min_length", 0) + 10, int(kwargs["max_length"] * spec["max_tokens_scale"]))
+    kwargs["num_beams"] = spec["num_beams"]
+    kwargs["repetition_penalty"] = spec["repetition_penalty"]
+    if spec["num_beams"] > 1:
+        kwargs["length_penalty"] = spec["length_penalty"] + (0.1 if is_last_chunk else 0.0)
+        kwargs["early_stopping"] = True
+    else:
+        kwargs.pop("length_penalty", None)
+        kwargs.pop("early_stopping", None)
+    if "no_repeat_ngram_size" in spec:
+        kwargs["no_repeat_ngram_size"] = spec["no_repeat_ngram_size"]
+    return kwargs
+
+
+class TierSelector:
+    """Picks a decoding tier for ``auto`` requests from queue pressure and recent p95 latency.
+
+    Latencies of model-backed requests are kept for ``window_seconds``. The selector steps down
+    to ``balanced`` once p95 exceeds the SLO or the admission queue holds ``balanced_queue``
+    waiters per slot, and to ``fast`` at 1.5x the SLO or ``fast_queue`` waiters per slot.
+    """
+
+    def __init__(self, slo_ms: float, window_seconds: float = 120.0, balanced_queue: float = 0.5, fast_queue: float = 1.5,
+                 min_samples: int = 5):
+        self.slo = slo_ms / 1000.0
+        self.window_seconds = window_seconds
+        self.balanced_queue = balanced_queue
+        self.fast_queue = fast_queue
+        self.min_samples = min_samples
+        self._samples: deque = deque()
+        self._lock = threading.Lock()
+        self._selections = {tier: 0 for tier in DECODING_TIERS}
+
+    def record(self, seconds: float):
+        now = time.monotonic()
+        with self._lock:
+            self._samples.append((now, seconds))
+            self._expire(now)
+
+    def p95(self) -> Optional[float]:
+        with self._lock:
+            self._expire(time.monotonic())
+            if len(self._samples) < self.min_samples:
+                return None
+            latencies = sorted(seconds for _, seconds in self._samples)
+        return latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+
+    def choose(self, waiting: int, max_concurrent: int) -> str:
+        pressure = waiting / max(1, max_concurrent)
+        p95 = self.p95()
+        if pressure >= self.fast_queue or (p95 is not None and p95 > 1.5 * self.slo):
+            tier = "fast"
+        elif pressure >= self.balanced_queue or (p95 is not None and p95 > self.slo):
+            tier = "balanced"
+        else:
+            tier = "quality"
+        with self._lock:
+            self._selections[tier] += 1
+        return tier
+
+    def stats(self) -> dict:
+        p95 = self.p95()
+        with self._lock:
+            return {
+                "slo_ms": self.slo * 1000,
+                "window_seconds": self.window_seconds,
+                "samples": len(self._samples),
+                "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                "auto_selections": dict(self._selections),
+            }
+
+    def _expire(self, now: float):
+        cutoff = now - self.window_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
@@ -0,0 +1,113 @@
+import re
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+|\n{2,}')
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOPWORDS = frozenset(
+    "a an and are as at be been but by for from had has have he her his i if in into is it its "
+    "of on or our she so than that the their them then there these they this to was we were "
+    "what when which while who will with would you your also not no can could may might must "
+    "shall should do does did just about after before over under more most other some such only "
+    "own same very s t".split()
+)
+
+MAX_VOCABULARY = 4096
+MAX_GRAPH_SENTENCES = 1500
+MAX_SCORED_SENTENCES = 5000
+DAMPING = 0.85
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence.strip() for sentence in SENTENCE_SPLIT.split(text) if sentence and sentence.strip()]
+
+
+def tfidf_matrix(sentences: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """L2-normalised TF-IDF over the most frequent terms, as the ``(rows, cols, weights)`` of its nonzero cells.
+
+    Rows are sentences. Only the cells a sentence actually uses are stored, so memory grows
+    with the number of tokens rather than with sentences times vocabulary.
+    """
+    vocabulary = {}
+    rows, cols = [], []
+    for i, sentence in enumerate(sentences):
+        for token in TOKEN_PATTERN.findall(sentence.lower()):
+            if len(token) > 1 and token not in STOPWORDS:
+                rows.append(i)
+                cols.append(vocabulary.setdefault(token, len(vocabulary)))
+    if not vocabulary:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+
+    vocab_size = len(vocabulary)
+    cells, counts = np.unique(np.asarray(rows, dtype=np.int64) * vocab_size + np.asarray(cols, dtype=np.int64), return_counts=True)
+    rows, cols = cells // vocab_size, cells % vocab_size
+    df = np.bincount(cols, minlength=vocab_size)
+    if vocab_size > MAX_VOCABULARY:
+        keep = np.argsort(-df, kind="stable")[:MAX_VOCABULARY]
+        remap = np.full(vocab_size, -1, dtype=np.int64)
+        remap[keep] = np.arange(len(keep))
+        cols = remap[cols]
+        mask = cols >= 0
+        rows, cols, counts, df = rows[mask], cols[mask], counts[mask], df[keep]
+
+    idf = np.log((1.0 + len(sentences)) / (1.0 + df)) + 1.0
+    weights = np.log1p(counts) * idf[cols]
+    norms = np.sqrt(np.bincount(rows, weights * weights, minlength=len(sentences)))
+    return rows, cols, weights / np.maximum(norms[rows], 1e-12)
+
+
+def textrank(similarity: np.ndarray, damping: float = DAMPING, iterations: int = 50, tolerance: float = 1e-6) -> np.ndarray:
+    n = similarity.shape[0]
+    graph = similarity.copy()
+    np.fill_diagonal(graph, 0.0)
+    out_weight = graph.sum(axis=1, keepdims=True)
+    transition = np.where(out_weight > 0, graph / np.maximum(out_weight, 1e-12), 1.0 / n)
+    scores = np.full(n, 1.0 / n, dtype=np.float64)
+    for _ in range(iterations):
+        updated = (1.0 - damping) / n + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < tolerance:
+            return updated
+        scores = updated
+    return scores
+
+
+def score_sentences(sentences: List[str]) -> np.ndarray:
+    """TextRank over the TF-IDF cosine graph; very long inputs fall back to centroid similarity."""
+    if len(sentences) < 3:
+        return np.ones(len(sentences))
+    rows, cols, weights = tfidf_matrix(sentences)
+    if not len(weights):
+        return np.ones(len(sentences))
+    if len(sentences) > MAX_GRAPH_SENTENCES:
+        centroid = np.bincount(cols, weights) / len(sentences)
+        return np.bincount(rows, weights * centroid[cols], minlength=len(sentences))
+    matrix = np.zeros((len(sentences), cols.max() + 1), dtype=np.float32)
+    matrix[rows, cols] = weights
+    return textrank(matrix @ matrix.T)
+
+
+def select_sentences(text: str, budget_chars: int, sentences: Optional[List[str]] = None) -> Tuple[str, int, int]:
+    """Keep the top-ranked sentences, in document order, until ``budget_chars`` is used.
+
+    ``sentences`` can be passed when the caller has already segmented ``text``. Past
+    ``MAX_SCORED_SENTENCES``, runs of consecutive sentences are ranked and kept together.
+    Returns the reduced text with the number of sentences kept and in the input.
+    """
+    if sentences is None:
+        sentences = split_sentences(text)
+    if not sentences:
+        return text, 0, 0
+    run = -(-len(sentences) // MAX_SCORED_SENTENCES)
+    units = sentences if run == 1 else [" ".join(sentences[i:i + run]) for i in range(0, len(sentences), run)]
+    lengths = np.fromiter((len(unit) + 1 for unit in units), dtype=np.int64, count=len(units))
+    if lengths.sum() <= budget_chars:
+        return " ".join(units), len(sentences), len(sentences)
+
+    order = np.argsort(-score_sentences(units), kind="stable")
+    within_budget = np.cumsum(lengths[order]) <= budget_chars
+    within_budget[0] = True
+    kept = np.sort(order[within_budget])
+    kept_sentences = int(np.minimum(run, len(sentences) - kept * run).sum())
+    return " ".join(units[i] for i in kept), kept_sentences, len(sentences)
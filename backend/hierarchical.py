@@ -0,0 +1,190 @@
+import time
+from concurrent.futures import Future
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from preprocess import SENTENCE_BOUNDARY
+
+
+def _resolved(value: str) -> Future:
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class LeafSplitter:
+    """Cuts a stream of text pieces into leaves of at most ``max_chars`` characters.
+
+    Leaves end at the last sentence boundary in the second half of the window when there is
+    one, and are shrunk until ``count_tokens`` fits ``max_tokens`` when a tokenizer is given.
+    Only the unconsumed tail of the stream is buffered.
+    """
+
+    def __init__(self, max_chars: int, count_tokens: Optional[Callable[[str], int]] = None, max_tokens: Optional[int] = None):
+        self.max_chars = max(200, max_chars)
+        self.count_tokens = count_tokens
+        self.max_tokens = max_tokens
+        self.consumed_chars = 0
+        self._buffer = ""
+
+    def feed(self, piece: str) -> Iterator[str]:
+        self._buffer += piece
+        self.consumed_chars += len(piece)
+        while len(self._buffer) >= self.max_chars + self.max_chars // 4:
+            leaf = self._cut()
+            if leaf:
+                yield leaf
+
+    def finish(self) -> Iterator[str]:
+        while self._buffer.strip():
+            leaf = self._cut(final=True)
+            if leaf:
+                yield leaf
+        self._buffer = ""
+
+    def _cut(self, final: bool = False) -> str:
+        window = self._buffer[:self.max_chars]
+        cut = len(window) if final and len(self._buffer) <= self.max_chars else 0
+        if not cut:
+            for match in SENTENCE_BOUNDARY.finditer(window, self.max_chars // 2):
+                cut = match.end()
+        if not cut:
+            cut = window.rfind(" ", self.max_chars // 2) + 1 or len(window)
+        leaf = self._fit(self._buffer[:cut])
+        self._buffer = self._buffer[len(leaf):]
+        return leaf.strip()
+
+    def _fit(self, leaf: str) -> str:
+        if self.count_tokens is None or self.max_tokens is None:
+            return leaf
+        tokens = self.count_tokens(leaf)
+        while tokens > self.max_tokens and len(leaf) > 100:
+            target = int(len(leaf) * self.max_tokens / tokens * 0.95)
+            cut = leaf.rfind(" ", 0, target)
+            leaf = leaf[:cut + 1 if cut > 0 else target]
+            tokens = self.count_tokens(leaf)
+        return leaf
+
+
+class TreeReducer:
+    """Streaming map-reduce over leaf summaries with bounded memory.
+
+    ``submit(text, level)`` starts a generation and returns a Future. Level 0 holds leaf
+    summaries. Once a level holds two groups of ``fan_in`` nodes, the older group is joined
+    and summarized one level up while the newer one stays in flight, so every level keeps at
+    most ``2 * fan_in`` nodes and memory grows with the tree height, not the document.
+    ``finish`` collects the remaining nodes in document order and keeps reducing groups until
+    the joined text fits ``target_chars``.
+
+    Past ``deadline`` (a ``time.monotonic()`` value) no new generations are started and
+    pending ones are abandoned; those nodes use ``fallback`` instead, and ``leaf_modes``
+    records which leaves ended up abstractive or extractive.
+    """
+
+    def __init__(self, submit: Callable[[str, int], Future], fallback: Callable[[str], str], fan_in: int = 4,
+                 check_cancelled: Optional[Callable[[], None]] = None, on_leaf: Optional[Callable[[int, str], None]] = None,
+                 deadline: Optional[float] = None):
+        self.submit = submit
+        self.fallback = fallback
+        self.fan_in = max(2, fan_in)
+        self.check_cancelled = check_cancelled
+        self.on_leaf = on_leaf
+        self.deadline = deadline
+        self.leaves = 0
+        self.fallbacks = 0
+        self.budget_exhausted = False
+        self.leaf_modes: List[str] = []
+        self._levels: List[List[Tuple[Optional[Future], str]]] = []
+        self._level_stats: List[dict] = []
+        self._leaves_emitted = 0
+
+    def add_leaf(self, text: str):
+        self._push(0, text)
+        self.leaves += 1
+
+    def finish(self, target_chars: int) -> str:
+        summaries = []
+        for level in reversed(range(len(self._levels))):
+            nodes, self._levels[level] = self._levels[level], []
+            summaries.extend(self._collect(nodes, level))
+
+        level = len(self._levels)
+        while len(summaries) > 1 and sum(len(summary) + 1 for summary in summaries) > target_chars:
+            nodes = []
+            for start in range(0, len(summaries), self.fan_in):
+                group = summaries[start:start + self.fan_in]
+                nodes.append(self._start(" ".join(group), level) if len(group) > 1 else (_resolved(group[0]), group[0]))
+            summaries = self._collect(nodes, level)
+            level += 1
+        return " ".join(summaries)
+
+    def cancel_pending(self):
+        for nodes in self._levels:
+            for future, _ in nodes:
+                if future is not None:
+                    future.cancel()
+            nodes.clear()
+
+    def level_stats(self) -> List[dict]:
+        return [
+            {
+                "level": level,
+                "nodes": stats["nodes"],
+                "input_chars": stats["input_chars"],
+                "output_chars": stats["output_chars"],
+                "ms": round((stats["finished"] - stats["started"]) * 1000, 2) if stats["finished"] else None,
+            }
+            for level, stats in enumerate(self._level_stats)
+        ]
+
+    def _push(self, level: int, text: str):
+        while len(self._levels) <= level:
+            self._levels.append([])
+        self._levels[level].append(self._start(text, level))
+        if len(self._levels[level]) >= self.fan_in * 2:
+            group, self._levels[level] = self._levels[level][:self.fan_in], self._levels[level][self.fan_in:]
+            self._push(level + 1, " ".join(self._collect(group, level)))
+
+    def _start(self, text: str, level: int) -> Tuple[Optional[Future], str]:
+        if self.check_cancelled is not None:
+            self.check_cancelled()
+        while len(self._level_stats) <= level:
+            self._level_stats.append({"nodes": 0, "input_chars": 0, "output_chars": 0, "started": None, "finished": None})
+        stats = self._level_stats[level]
+        stats["nodes"] += 1
+        stats["input_chars"] += len(text)
+        if stats["started"] is None:
+            stats["started"] = time.perf_counter()
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.budget_exhausted = True
+            return None, text
+        return self.submit(text, level), text
+
+    def _collect(self, nodes: List[Tuple[Optional[Future], str]], level: int) -> List[str]:
+        summaries = []
+        for future, text in nodes:
+            if self.check_cancelled is not None:
+                self.check_cancelled()
+            summary = ""
+            if future is not None:
+                timeout = None if self.deadline is None else max(0.0, self.deadline - time.monotonic())
+                try:
+                    summary = future.result(timeout=timeout).strip()
+                except TimeoutError:
+                    future.cancel()
+                    self.budget_exhausted = True
+                except Exception:
+                    pass
+            extractive = len(summary) < 20
+            if extractive:
+                summary = self.fallback(text)
+                self.fallbacks += 1
+            if level == 0:
+                self.leaf_modes.append("extractive" if extractive else "abstractive")
+            stats = self._level_stats[level]
+            stats["output_chars"] += len(summary)
+            stats["finished"] = time.perf_counter()
+            if level == 0 and self.on_leaf is not None:
+                self.on_leaf(self._leaves_emitted, summary)
+                self._leaves_emitted += 1
+            summaries.append(summary)
+        return summaries
@@ -0,0 +1,289 @@
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+READY_TIMEOUT_S = 600.0
+MONITOR_INTERVAL_S = 1.0
+
+
+def _read_int(path: str) -> Optional[int]:
+    try:
+        with open(path) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def physical_cores() -> List[List[int]]:
+    """Group the CPUs this process may run on into physical cores (hyperthread siblings together)."""
+    if hasattr(os, "sched_getaffinity"):
+        allowed = sorted(os.sched_getaffinity(0))
+    else:
+        allowed = list(range(os.cpu_count() or 1))
+
+    cores: Dict[Tuple[int, int], List[int]] = {}
+    for cpu in allowed:
+        base = f"/sys/devices/system/cpu/cpu{cpu}/topology"
+        package = _read_int(f"{base}/physical_package_id")
+        core = _read_int(f"{base}/core_id")
+        if package is None or core is None:
+            package, core = 0, cpu
+        cores.setdefault((package, core), []).append(cpu)
+    return [sorted(cpus) for _, cpus in sorted(cores.items())]
+
+
+def plan_core_sets(num_workers: int, cores_per_worker: int) -> List[List[int]]:
+    """Split physical cores into disjoint per-worker CPU sets.
+
+    ``num_workers <= 0`` means as many workers as fit. Workers are laid out on consecutive
+    physical cores so each one stays within a socket where possible.
+    """
+    cores = physical_cores()
+    cores_per_worker = max(1, cores_per_worker)
+    if num_workers <= 0:
+        num_workers = max(1, len(cores) // cores_per_worker)
+    if num_workers * cores_per_worker > len(cores):
+        cores_per_worker = max(1, len(cores) // num_workers)
+        logger.warning(f"Not enough physical cores for requested layout, using {cores_per_worker} cores per worker")
+
+    core_sets = []
+    for i in range(num_workers):
+        assigned = cores[i * cores_per_worker:(i + 1) * cores_per_worker]
+        if not assigned:
+            assigned = [cores[i % len(cores)]]
+        core_sets.append(sorted(itertools.chain.from_iterable(assigned)))
+    return core_sets
+
+
+def _worker_main(worker_id: int, cpus: List[int], model_keys: List[str], job_queue, result_queue):
+    intra_op_threads = str(max(1, len(cpus)))
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = intra_op_threads
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+
+    import torch
+    from models import build_pipeline, run_batch
+
+    torch.set_num_threads(int(intra_op_threads))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass
+
+    pipelines = {}
+    for model_key in model_keys:
+        try:
+            pipelines[model_key] = build_pipeline(model_key)
+        except Exception as e:
+            result_queue.put(("log", worker_id, None, f"Failed to load {model_key}: {e}"))
+    result_queue.put(("ready", worker_id, None, list(pipelines)))
+
+    while True:
+        job = job_queue.get()
+        if job is None:
+            break
+        job_id, model_key, texts, gen_kwargs = job
+        try:
+            result_queue.put(("ok", worker_id, job_id, run_batch(pipelines[model_key], texts, gen_kwargs)))
+        except Exception as e:
+            result_queue.put(("error", worker_id, job_id, f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    def __init__(self, worker_id: int, cpus: List[int]):
+        self.worker_id = worker_id
+        self.cpus = cpus
+        self.process = None
+        self.job_queue = None
+        self.inflight: Dict[int, Future] = {}
+        self.ready = False
+        self.loaded_models: List[str] = []
+        self.restarts = 0
+        self.jobs_done = 0
+        self.started_at = 0.0
+
+
+class _PoolPipeline:
+    """Pipeline-compatible proxy so the pool can sit in the ``summarizers`` registry."""
+
+    def __init__(self, pool: "InferencePool", model_key: str):
+        self.pool = pool
+        self.model_key = model_key
+
+    def run_batch(self, inputs: list, gen_kwargs: dict) -> List[str]:
+        return self.pool.submit(self.model_key, list(inputs), gen_kwargs).result()
+
+
+class InferencePool:
+    """Shards generation across worker processes, each pinned to a disjoint core set."""
+
+    def __init__(self, model_keys: List[str], num_workers: int = 0, cores_per_worker: int = 4):
+        self.model_keys = list(model_keys)
+        self._ctx = mp.get_context("spawn")
+        self._workers = [_Worker(i, cpus) for i, cpus in enumerate(plan_core_sets(num_workers, cores_per_worker))]
+        self._result_queue = self._ctx.Queue()
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count()
+        self._running = False
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def size(self) -> int:
+        return len(self._workers)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self, wait_ready: bool = True):
+        self._running = True
+        for worker in self._workers:
+            self._spawn(worker)
+        for target, name in ((self._collect, "inference-pool-collector"), (self._monitor, "inference-pool-monitor")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Inference pool started: {self.size} workers, core sets={[w.cpus for w in self._workers]}")
+        if wait_ready:
+            self.wait_ready()
+
+    def wait_ready(self, timeout: float = READY_TIMEOUT_S):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if all(w.ready for w in self._workers):
+                    return
+            time.sleep(0.1)
+        raise TimeoutError("Inference pool workers did not become ready in time")
+
+    def loaded_models(self) -> List[str]:
+        with self._lock:
+            loaded = [set(w.loaded_models) for w in self._workers if w.ready]
+        return sorted(set.intersection(*loaded)) if loaded else []
+
+    def pipeline(self, model_key: str) -> _PoolPipeline:
+        return _PoolPipeline(self, model_key)
+
+    def submit(self, model_key: str, texts: List[str], gen_kwargs: dict) -> Future:
+        future = Future()
+        job_id = next(self._job_ids)
+        with self._lock:
+            if not self._running:
+                raise RuntimeError("Inference pool is not running")
+            candidates = [w for w in self._workers if w.ready and w.process.is_alive()]
+            if not candidates:
+                raise RuntimeError("No inference workers available")
+            worker = min(candidates, key=lambda w: len(w.inflight))
+            worker.inflight[job_id] = future
+            worker.job_queue.put((job_id, model_key, texts, gen_kwargs))
+        return future
+
+    def health(self) -> dict:
+        with self._lock:
+            workers = [
+                {
+                    "worker_id": w.worker_id,
+                    "pid": w.process.pid if w.process else None,
+                    "alive": bool(w.process and w.process.is_alive()),
+                    "ready": w.ready,
+                    "cpus": w.cpus,
+                    "inflight": len(w.inflight),
+                    "jobs_done": w.jobs_done,
+                    "restarts": w.restarts,
+                    "uptime_s": round(time.monotonic() - w.started_at, 1) if w.started_at else 0.0,
+                }
+                for w in self._workers
+            ]
+        return {
+            "backend": "process_pool",
+            "workers": workers,
+            "healthy_workers": sum(1 for w in workers if w["alive"] and w["ready"]),
+        }
+
+    def shutdown(self, timeout: float = 10.0):
+        with self._lock:
+            self._running = False
+            workers = list(self._workers)
+        for worker in workers:
+            if worker.process and worker.process.is_alive():
+                worker.job_queue.put(None)
+        for worker in workers:
+            if worker.process:
+                worker.process.join(timeout)
+                if worker.process.is_alive():
+                    worker.process.terminate()
+            self._fail_inflight(worker, RuntimeError("Inference pool shut down"))
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _spawn(self, worker: _Worker):
+        worker.job_queue = self._ctx.Queue()
+        worker.ready = False
+        worker.loaded_models = []
+        worker.started_at = time.monotonic()
+        worker.process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker.worker_id, worker.cpus, self.model_keys, worker.job_queue, self._result_queue),
+            name=f"inference-worker-{worker.worker_id}",
+            daemon=True
+        )
+        worker.process.start()
+
+    def _fail_inflight(self, worker: _Worker, error: Exception):
+        with self._lock:
+            inflight, worker.inflight = worker.inflight, {}
+        for future in inflight.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def _collect(self):
+        while self._running:
+            try:
+                kind, worker_id, job_id, payload = self._result_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+            worker = self._workers[worker_id]
+            if kind == "ready":
+                with self._lock:
+                    worker.ready = True
+                    worker.loaded_models = payload
+                logger.info(f"Inference worker {worker_id} ready on cpus {worker.cpus} with models {payload}")
+                continue
+            if kind == "log":
+                logger.error(f"Inference worker {worker_id}: {payload}")
+                continue
+            with self._lock:
+                future = worker.inflight.pop(job_id, None)
+                worker.jobs_done += 1
+            if future is None or future.done():
+                continue
+            if kind == "ok":
+                future.set_result(payload)
+            else:
+                future.set_exception(RuntimeError(payload))
+
+    def _monitor(self):
+        while self._running:
+            time.sleep(MONITOR_INTERVAL_S)
+            for worker in self._workers:
+                if not self._running:
+                    return
+                if worker.process.is_alive():
+                    continue
+                logger.error(f"Inference worker {worker.worker_id} (pid {worker.process.pid}) died with exit code {worker.process.exitcode}, restarting")
+                self._fail_inflight(worker, RuntimeError(f"Inference worker {worker.worker_id} crashed"))
+                with self._lock:
+                    worker.restarts += 1
+                    self._spawn(worker)
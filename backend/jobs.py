@@ -0,0 +1,260 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DocumentProcessor = Callable[[str, dict], Awaitable[dict]]
+
+
+class JobStore:
+    """SQLite-backed state for bulk summarization jobs.
+
+    Every document row carries its own status, so a restart only re-queues the documents
+    that were pending or in flight. Finished documents get a per-job sequence number that
+    clients use as a cursor to fetch results incrementally.
+    """
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, options TEXT NOT NULL, total INTEGER NOT NULL, "
+            "completed INTEGER NOT NULL DEFAULT 0, failed INTEGER NOT NULL DEFAULT 0, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS job_documents ("
+            "job_id TEXT NOT NULL, idx INTEGER NOT NULL, doc_id TEXT, text TEXT NOT NULL, length INTEGER NOT NULL, "
+            "status TEXT NOT NULL, result TEXT, error TEXT, seq INTEGER, url TEXT, PRIMARY KEY (job_id, idx))"
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(job_documents)").fetchall()}
+        if "url" not in columns:
+            self._db.execute("ALTER TABLE job_documents ADD COLUMN url TEXT")
+        self._db.execute("CREATE INDEX IF NOT EXISTS job_documents_pending ON job_documents(status, job_id, length)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS job_documents_seq ON job_documents(job_id, seq)")
+
+    def create(self, documents: List[Tuple[Optional[str], str, Optional[str]]], options: dict) -> dict:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN")
+            self._db.execute(
+                "INSERT INTO jobs (id, status, options, total, created_at, updated_at) VALUES (?, 'queued', ?, ?, ?, ?)",
+                (job_id, json.dumps(options), len(documents), now, now)
+            )
+            self._db.executemany(
+                "INSERT INTO job_documents (job_id, idx, doc_id, text, length, status, url) VALUES (?, ?, ?, ?, ?, 'pending', ?)",
+                [(job_id, idx, doc_id, text, len(text), url) for idx, (doc_id, text, url) in enumerate(documents)]
+            )
+            self._db.execute("COMMIT")
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, status, options, total, completed, failed, created_at, updated_at FROM jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job_id, status, options, total, completed, failed, created_at, updated_at = row
+        return {
+            "job_id": job_id,
+            "status": status,
+            "options": json.loads(options),
+            "total": total,
+            "completed": completed,
+            "failed": failed,
+            "remaining": total - completed - failed,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+
+    def claim(self, limit: int) -> List[dict]:
+        """Mark up to ``limit`` pending documents of the oldest active jobs as running, shortest first."""
+        if limit <= 0:
+            return []
+        now = time.time()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT d.job_id, d.idx, d.doc_id, d.text, j.options, d.url FROM job_documents d JOIN jobs j ON j.id = d.job_id "
+                "WHERE d.status = 'pending' AND j.status IN ('queued', 'running') "
+                "ORDER BY j.created_at, d.length LIMIT ?",
+                (limit,)
+            ).fetchall()
+            if not rows:
+                return []
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "UPDATE job_documents SET status = 'running' WHERE job_id = ? AND idx = ?",
+                [(job_id, idx) for job_id, idx, _, _, _, _ in rows]
+            )
+            self._db.executemany(
+                "UPDATE jobs SET status = 'running', updated_at = ? WHERE id = ? AND status = 'queued'",
+                [(now, job_id) for job_id in {row[0] for row in rows}]
+            )
+            self._db.execute("COMMIT")
+        documents = []
+        for job_id, idx, doc_id, text, options, url in rows:
+            options = json.loads(options)
+            if url:
+                options["source_url"] = url
+            documents.append({"job_id": job_id, "index": idx, "id": doc_id, "text": text, "options": options})
+        return documents
+
+    def finish(self, job_id: str, idx: int, result: Optional[dict] = None, error: Optional[str] = None):
+        counter = "completed" if error is None else "failed"
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN")
+            seq = self._db.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM job_documents WHERE job_id = ?", (job_id,)).fetchone()[0]
+            self._db.execute(
+                "UPDATE job_documents SET status = ?, result = ?, error = ?, seq = ? WHERE job_id = ? AND idx = ?",
+                (counter, json.dumps(result) if result is not None else None, error, seq, job_id, idx)
+            )
+            self._db.execute(f"UPDATE jobs SET {counter} = {counter} + 1, updated_at = ? WHERE id = ?", (now, job_id))
+            self._db.execute(
+                "UPDATE jobs SET status = 'completed' WHERE id = ? AND status = 'running' AND completed + failed >= total",
+                (job_id,)
+            )
+            self._db.execute("COMMIT")
+
+    def results(self, job_id: str, after: int = 0, limit: int = 100) -> List[dict]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT idx, doc_id, status, result, error, seq FROM job_documents "
+                "WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, after, limit)
+            ).fetchall()
+        results = []
+        for idx, doc_id, status, result, error, seq in rows:
+            entry = {"index": idx, "id": doc_id, "status": status, "seq": seq}
+            if result is not None:
+                entry["result"] = json.loads(result)
+            if error is not None:
+                entry["error"] = error
+            results.append(entry)
+        return results
+
+    def cancel(self, job_id: str) -> bool:
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN")
+            updated = self._db.execute(
+                "UPDATE jobs SET status = 'cancelled', updated_at = ? WHERE id = ? AND status IN ('queued', 'running')",
+                (now, job_id)
+            ).rowcount
+            if updated:
+                self._db.execute("UPDATE job_documents SET status = 'cancelled' WHERE job_id = ? AND status = 'pending'", (job_id,))
+            self._db.execute("COMMIT")
+        return bool(updated)
+
+    def recover(self) -> int:
+        """Re-queue documents left running by a previous process."""
+        with self._lock:
+            return self._db.execute("UPDATE job_documents SET status = 'pending' WHERE status = 'running'").rowcount
+
+    def purge_finished(self, older_than_seconds: float) -> int:
+        cutoff = time.time() - older_than_seconds
+        with self._lock:
+            self._db.execute("BEGIN")
+            expired = [row[0] for row in self._db.execute(
+                "SELECT id FROM jobs WHERE status IN ('completed', 'cancelled') AND updated_at < ?", (cutoff,)
+            ).fetchall()]
+            for job_id in expired:
+                self._db.execute("DELETE FROM job_documents WHERE job_id = ?", (job_id,))
+                self._db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            self._db.execute("COMMIT")
+        return len(expired)
+
+    def stats(self) -> dict:
+        with self._lock:
+            jobs = dict(self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+            documents = dict(self._db.execute(
+                "SELECT d.status, COUNT(*) FROM job_documents d JOIN jobs j ON j.id = d.job_id "
+                "WHERE j.status IN ('queued', 'running') GROUP BY d.status"
+            ).fetchall())
+        return {"jobs": jobs, "active_documents": documents}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class JobRunner:
+    """Drains pending job documents through ``process`` with bounded concurrency.
+
+    Documents are claimed shortest first so the ones in flight together have similar chunk
+    counts and their chunk generations line up in the batch scheduler.
+    """
+
+    def __init__(self, store: JobStore, process: DocumentProcessor, concurrency: int = 2, idle_poll_seconds: float = 5.0):
+        self.store = store
+        self.process = process
+        self.concurrency = max(1, concurrency)
+        self.idle_poll_seconds = idle_poll_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._active: Set[asyncio.Task] = set()
+        self._stats = {"documents_completed": 0, "documents_failed": 0}
+
+    def start(self):
+        recovered = self.store.recover()
+        if recovered:
+            logger.info(f"Resuming {recovered} job documents left unfinished by the previous run")
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def notify(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def shutdown(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        for task in list(self._active):
+            task.cancel()
+        await asyncio.gather(self._task, *self._active, return_exceptions=True)
+        self._task = None
+
+    def stats(self) -> dict:
+        return {**self._stats, "in_flight": len(self._active), "concurrency": self.concurrency}
+
+    async def _run(self):
+        while True:
+            for document in self.store.claim(self.concurrency - len(self._active)):
+                self._active.add(asyncio.get_running_loop().create_task(self._process(document)))
+            self._wakeup.clear()
+            wakeup = asyncio.ensure_future(self._wakeup.wait())
+            try:
+                done, _ = await asyncio.wait(self._active | {wakeup}, timeout=self.idle_poll_seconds, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                wakeup.cancel()
+            self._active -= done
+
+    async def _process(self, document: dict):
+        job_id, idx = document["job_id"], document["index"]
+        try:
+            result = await self.process(document["text"], document["options"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = getattr(e, "detail", None) or str(e) or type(e).__name__
+            logger.warning(f"Job {job_id} document {idx} failed: {error}")
+            self.store.finish(job_id, idx, error=str(error))
+            self._stats["documents_failed"] += 1
+            return
+        self.store.finish(job_id, idx, result=result)
+        self._stats["documents_completed"] += 1
@@ -0,0 +1,103 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+STAGE_SECONDS = Histogram(
+    "contentsnap_stage_seconds",
+    "Time spent in each summarization stage",
+    ["stage", "model"],
+    buckets=STAGE_BUCKETS
+)
+REQUEST_SECONDS = Histogram(
+    "contentsnap_request_seconds",
+    "End-to-end request latency",
+    ["endpoint", "cached"],
+    buckets=STAGE_BUCKETS
+)
+REQUESTS = Counter(
+    "contentsnap_requests_total",
+    "Summarization requests by outcome",
+    ["endpoint", "status"]
+)
+REJECTIONS = Counter(
+    "contentsnap_admission_rejections_total",
+    "Requests turned away by admission control",
+    ["model", "reason"]
+)
+TIER_SELECTIONS = Counter(
+    "contentsnap_decoding_tier_total",
+    "Decoding tier used per request, by requested mode",
+    ["tier", "requested"]
+)
+BOILERPLATE_BLOCKS = Counter(
+    "contentsnap_boilerplate_blocks_removed_total",
+    "Blocks dropped before summarization, by reason",
+    ["reason"]
+)
+BOILERPLATE_CHARS = Counter(
+    "contentsnap_boilerplate_chars_removed_total",
+    "Characters dropped before summarization"
+)
+FALLBACKS = Counter(
+    "contentsnap_fallbacks_total",
+    "Chunks that fell back to sentence extraction, by path",
+    ["kind"]
+)
+CHUNKS = Counter(
+    "contentsnap_chunks_total",
+    "Chunks processed, by source",
+    ["model", "source"]
+)
+BATCH_SIZE = Histogram(
+    "contentsnap_generation_batch_size",
+    "Inputs per model generation call",
+    ["model"],
+    buckets=(1, 2, 4, 8, 16, 32, 64)
+)
+INFLIGHT = Gauge(
+    "contentsnap_inflight_requests",
+    "Requests currently being summarized, by model key",
+    ["model"]
+)
+EXECUTOR_QUEUE_DEPTH = Gauge(
+    "contentsnap_executor_queue_depth",
+    "Summarization jobs waiting for an executor thread"
+)
+ROUTING_DECISIONS = Counter(
+    "contentsnap_routing_decisions_total",
+    "Requests routed to each model, by the constraint that decided it",
+    ["model", "reason"]
+)
+PROCESS_MEMORY = Gauge(
+    "contentsnap_process_memory_bytes",
+    "Resident memory of this worker process, split into memory unique to it and memory shared with others",
+    ["kind"]
+)
+
+
+def observe_stage(stage: str, seconds: float, model: str = "", timings: Optional[Dict[str, float]] = None):
+    STAGE_SECONDS.labels(stage, model).observe(seconds)
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds * 1000
+
+
+@contextmanager
+def timed(stage: str, model: str = "", timings: Optional[Dict[str, float]] = None):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - started, model, timings)
+
+
+def server_timing(timings: Dict[str, float]) -> str:
+    return ", ".join(f"{stage};dur={ms:.2f}" for stage, ms in timings.items())
+
+
+def render() -> bytes:
+    return generate_latest()
+
@@ -0,0 +1,171 @@
+import logging
+import os
+from typing import Dict, List, Optional, Sequence, Union
+
+import settings
+
+logger = logging.getLogger(__name__)
+
+ModelInput = Union[str, Sequence[int]]
+
+MODEL_SPECS: Dict[str, str] = {
+    "bart": "facebook/bart-large-cnn",
+    "t5": "t5-base",
+    "distilbart": "sshleifer/distilbart-cnn-12-6",
+    "t5_small": "t5-small",
+}
+
+MODEL_MAX_INPUT_TOKENS: Dict[str, int] = {
+    "bart": 1024,
+    "t5": 512,
+    "distilbart": 1024,
+    "t5_small": 512,
+}
+
+MODEL_PREFIXES: Dict[str, str] = {
+    "t5": "summarize: ",
+    "t5_small": "summarize: ",
+}
+
+# Quality rank (1-3) and prior CPU cost per 1k input tokens at 4 beams, used by the router
+# until it has measured the model; benchmarks/profile_models.py produces measured values.
+MODEL_PROFILES: Dict[str, dict] = {
+    "bart": {"family": "bart", "quality": 3, "ms_per_1k_tokens": 6000.0},
+    "distilbart": {"family": "bart", "quality": 2, "ms_per_1k_tokens": 3300.0},
+    "t5": {"family": "t5", "quality": 2, "ms_per_1k_tokens": 3000.0},
+    "t5_small": {"family": "t5", "quality": 1, "ms_per_1k_tokens": 900.0},
+}
+
+MODEL_ALIASES: Dict[str, str] = {
+    "pegasus": "bart",
+    "long_text": "bart",
+}
+
+
+def resolve_model_key(model_key: str) -> str:
+    return MODEL_ALIASES.get(model_key, model_key)
+
+
+BACKENDS = ("torch", "int8", "onnx", "stub")
+
+
+def model_backend(model_key: str) -> str:
+    return settings.MODEL_BACKENDS.get(model_key, "torch")
+
+
+def _torch_pipeline(model_key: str):
+    from transformers import pipeline
+
+    model_name = MODEL_SPECS[model_key]
+    model = model_name
+    if settings.SHARED_WEIGHTS:
+        from shared_weights import load_mapped_model
+
+        model = load_mapped_model(model_name)
+    return pipeline(
+        "summarization",
+        model=model,
+        tokenizer=model_name,
+        device=-1,
+        clean_up_tokenization_spaces=True
+    )
+
+
+def _int8_pipeline(model_key: str):
+    import torch
+
+    summarizer = _torch_pipeline(model_key)
+    summarizer.model = torch.ao.quantization.quantize_dynamic(
+        summarizer.model.eval(), {torch.nn.Linear}, dtype=torch.qint8
+    )
+    return summarizer
+
+
+def _onnx_pipeline(model_key: str):
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError as e:
+        raise RuntimeError("The onnx backend requires 'optimum[onnxruntime]' to be installed") from e
+    from transformers import AutoTokenizer, pipeline
+
+    model_name = MODEL_SPECS[model_key]
+    export_dir = os.path.join(settings.ONNX_EXPORT_DIR, model_key)
+    if os.path.isdir(export_dir):
+        model = ORTModelForSeq2SeqLM.from_pretrained(export_dir)
+    else:
+        logger.info(f"Exporting {model_name} to ONNX at {export_dir}")
+        model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+        model.save_pretrained(export_dir)
+    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+    return pipeline(
+        "summarization",
+        model=model,
+        tokenizer=tokenizer,
+        device=-1,
+        clean_up_tokenization_spaces=True
+    )
+
+
+def build_pipeline(model_key: str, backend: Optional[str] = None, fallback: bool = True):
+    backend = backend or model_backend(model_key)
+    if backend == "torch":
+        return _torch_pipeline(model_key)
+    if backend == "stub":
+        from stub_models import StubSummarizer
+
+        return StubSummarizer(delay_ms=settings.STUB_DELAY_MS)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}' for {model_key}, expected one of {BACKENDS}")
+    try:
+        if backend == "int8":
+            return _int8_pipeline(model_key)
+        return _onnx_pipeline(model_key)
+    except Exception as e:
+        if not fallback:
+            raise
+        logger.error(f"Failed to build {backend} backend for {model_key}, falling back to torch: {e}")
+        return _torch_pipeline(model_key)
+
+
+def build_tokenizer(model_key: str):
+    if model_backend(model_key) == "stub":
+        from stub_models import StubTokenizer
+
+        return StubTokenizer()
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(MODEL_SPECS[model_key], use_fast=True)
+
+
+def max_input_tokens(model_key: str, tokenizer) -> int:
+    return min(MODEL_MAX_INPUT_TOKENS.get(model_key, tokenizer.model_max_length), tokenizer.model_max_length)
+
+
+def generate_from_ids(summarizer, batch_ids: List[Sequence[int]], gen_kwargs: dict) -> List[str]:
+    import torch
+
+    gen_kwargs = {k: v for k, v in gen_kwargs.items() if k != "truncation"}
+    tokenizer = summarizer.tokenizer
+    padded = tokenizer.pad({"input_ids": [list(ids) for ids in batch_ids]}, return_tensors="pt")
+    with torch.inference_mode():
+        output_ids = summarizer.model.generate(
+            input_ids=padded["input_ids"],
+            attention_mask=padded["attention_mask"],
+            **gen_kwargs
+        )
+    return tokenizer.batch_decode(output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=True)
+
+
+def run_batch(summarizer, inputs: List[ModelInput], gen_kwargs: dict) -> List[str]:
+    if hasattr(summarizer, "run_batch"):
+        return summarizer.run_batch(inputs, gen_kwargs)
+    if inputs and not isinstance(inputs[0], str):
+        return generate_from_ids(summarizer, inputs, gen_kwargs)
+    results = summarizer(list(inputs), batch_size=len(inputs), **gen_kwargs)
+    return [summary_text(r) for r in results]
+
+
+def summary_text(result) -> str:
+    if isinstance(result, list):
+        result = result[0]
+    return result['summary_text']
@@ -0,0 +1,136 @@
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+# Splitting with the separators kept makes the running sum of piece lengths the alternating
+# sentence ends and starts, which accumulate computes without a Python-level loop.
+SENTENCE_PIECES = re.compile(r'(?<=[.!?])(\s+)')
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+# Everything clean_text drops, whitespace included, so one substitution both removes
+# unsupported characters and collapses the gaps they leave to a single space.
+DISCARD = re.compile(r'[^\w.,!?;:\-()"\'\[\]*/]+')
+
+# str.translate takes its slow per-character path for non-Latin-1 and multi-character
+# mappings, so these few characters are replaced one by one instead.
+REPLACEMENTS = (
+    ('–', '-'), ('—', '-'),
+    ('…', '...'),
+    ('★', '*'),
+    ('🎬', '[Movie]'),
+    ('💖', '[Heart]'),
+)
+
+
+def fold(text: str) -> str:
+    """NFKD-normalize and map the decorative characters we keep; pure ASCII passes through untouched."""
+    if text.isascii():
+        return text
+    text = unicodedata.normalize('NFKD', text)
+    for old_char, new_char in REPLACEMENTS:
+        if old_char in text:
+            text = text.replace(old_char, new_char)
+    return text
+
+
+def normalize_text(text: str) -> str:
+    return DISCARD.sub(' ', fold(text)).strip()
+
+
+class Document:
+    """Normalized text with paragraph and sentence spans stored as offsets.
+
+    Spans are kept in ``array`` columns rather than as substrings, so a long document costs
+    a few bytes per sentence on top of its text and any slice is cut only when asked for.
+    Sentences follow ``SENTENCE_BOUNDARY`` and match ``re.split`` on the same text.
+    """
+
+    __slots__ = ("text", "paragraph_starts", "sentence_starts", "sentence_ends")
+
+    def __init__(self, text: str, paragraph_starts: Optional[Sequence[int]] = None):
+        self.text = text
+        if paragraph_starts is None:
+            paragraph_starts = [0] + [match.end() for match in PARAGRAPH_BREAK.finditer(text)] if text else []
+        self.paragraph_starts = array("l", paragraph_starts)
+        offsets = array("l", accumulate(map(len, SENTENCE_PIECES.split(text)), initial=0)) if text else array("l")
+        self.sentence_starts = offsets[0:-1:2]
+        self.sentence_ends = offsets[1::2]
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentence_starts)
+
+    def sentence_spans(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+        return zip(self.sentence_starts[start:stop], self.sentence_ends[start:stop])
+
+    def sentences(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        text = self.text
+        return [text[a:b] for a, b in self.sentence_spans(start, stop)]
+
+    def span_sentences(self, start: int, end: int) -> List[str]:
+        """Sentences of ``text[start:end]`` read from the index, the first and last clipped to the span."""
+        first = bisect_right(self.sentence_ends, start)
+        stop = bisect_left(self.sentence_starts, end)
+        text = self.text
+        return [text[max(a, start):min(b, end)] for a, b in self.sentence_spans(first, stop)]
+
+    def locate(self, pieces: Sequence[str]) -> List[int]:
+        """Start offset of each piece, searched in order from the previous one; -1 where it is not a slice of the text."""
+        starts = []
+        cursor = 0
+        for piece in pieces:
+            start = self.text.find(piece, cursor)
+            starts.append(start)
+            cursor = max(cursor, start)
+        return starts
+
+    def paragraphs(self) -> List[str]:
+        ends = list(self.paragraph_starts[1:]) + [len(self.text)]
+        return [self.text[a:b].strip() for a, b in zip(self.paragraph_starts, ends)]
+
+
+def preprocess_text(text: str) -> Document:
+    """``normalize_text`` that also records where the paragraphs of the raw text start.
+
+    The output text is identical; paragraphs are joined by the same single space, so their
+    starts are the only trace of the blank lines the normalization collapses.
+    """
+    parts = []
+    starts = array("l")
+    length = 0
+    for paragraph in PARAGRAPH_BREAK.split(fold(text)):
+        cleaned = DISCARD.sub(' ', paragraph).strip()
+        if cleaned:
+            starts.append(length)
+            parts.append(cleaned)
+            length += len(cleaned) + 1
+    return Document(" ".join(parts), starts)
+
+
+class StreamNormalizer:
+    """Incremental ``normalize_text``: the concatenated output of ``feed`` equals normalizing the whole input.
+
+    Only whether a separating space is owed to the next piece is carried between pieces, so
+    arbitrarily large bodies are normalized in constant memory.
+    """
+
+    def __init__(self):
+        self.emitted_chars = 0
+        self._pending_space = False
+
+    def feed(self, piece: str) -> str:
+        text = DISCARD.sub(' ', fold(piece))
+        body = text.strip(' ')
+        if not body:
+            self._pending_space = self._pending_space or bool(text)
+            return ""
+        space = " " if self.emitted_chars and (self._pending_space or text[0] == " ") else ""
+        self._pending_space = text[-1] == " "
+        self.emitted_chars += len(space) + len(body)
+        return space + body
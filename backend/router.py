@@ -0,0 +1,133 @@
+import json
+import logging
+import os
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DETAIL_QUALITY = {"low": 1, "medium": 2, "high": 3}
+
+
+class ModelRouter:
+    """Routes each request to the cheapest registered model good enough for it.
+
+    ``profiles`` maps model keys to a quality rank and a prior cost in milliseconds per 1k
+    input tokens; the prior is replaced by an EWMA of observed generation time once a model
+    has served requests, and priors of unmeasured models are scaled by how far the measured
+    ones deviate from theirs. ``detail_level`` sets the minimum quality rank. It is relaxed by one
+    when the admission queue holds ``relax_queue`` waiters per slot, and again while the
+    cheapest qualifying model is not expected to meet the latency target. Among qualifying
+    models, loaded ones win so routing only blocks on a cold load when nothing loaded will
+    do; the model that would have won is returned too, so the caller can warm it up.
+    """
+
+    def __init__(self, profiles: Dict[str, dict], slo_ms: float, relax_queue: float = 1.0, smoothing: float = 0.2,
+                 history: int = 50):
+        self.profiles = profiles
+        self.slo_ms = slo_ms
+        self.relax_queue = relax_queue
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._measured: Dict[str, float] = {}
+        self._samples: Dict[str, int] = {model_key: 0 for model_key in profiles}
+        self._inflight: Dict[str, int] = {model_key: 0 for model_key in profiles}
+        self._decisions: Dict[str, Dict[str, int]] = {model_key: {} for model_key in profiles}
+        self._recent: deque = deque(maxlen=history)
+
+    @classmethod
+    def from_settings(cls, models: List[str], profiles: Dict[str, dict], profiles_path: Optional[str], slo_ms: float,
+                      relax_queue: float) -> "ModelRouter":
+        selected = {model_key: dict(profiles[model_key]) for model_key in models if model_key in profiles}
+        if profiles_path and os.path.exists(profiles_path):
+            with open(profiles_path) as f:
+                measured = json.load(f).get("models", {})
+            for model_key, profile in measured.items():
+                if model_key in selected and profile.get("ms_per_1k_tokens"):
+                    selected[model_key]["ms_per_1k_tokens"] = profile["ms_per_1k_tokens"]
+            logger.info(f"Loaded model cost profiles from {profiles_path}")
+        return cls(selected, slo_ms, relax_queue)
+
+    def cost(self, model_key: str) -> float:
+        with self._lock:
+            if model_key in self._measured:
+                return self._measured[model_key]
+            ratios = [cost / self.profiles[m]["ms_per_1k_tokens"] for m, cost in self._measured.items()]
+            scale = sum(ratios) / len(ratios) if ratios else 1.0
+            return self.profiles[model_key]["ms_per_1k_tokens"] * scale
+
+    def estimate_ms(self, model_key: str, tokens: int) -> float:
+        with self._lock:
+            queued = self._inflight[model_key]
+        return self.cost(model_key) * max(tokens, 1) / 1000 * (1 + queued)
+
+    def route(self, detail_level: str, tokens: int, families: Optional[List[str]], waiting: int, max_concurrent: int,
+              is_ready: Callable[[str], bool]) -> Tuple[str, str, str]:
+        """Return the chosen model, the reason for it, and the model that would be chosen if all were loaded."""
+        candidates = [m for m in self.profiles if families is None or self.profiles[m]["family"] in families]
+        candidates = candidates or list(self.profiles)
+        required = DETAIL_QUALITY.get(detail_level, 2)
+        reason = "detail"
+        if waiting / max(1, max_concurrent) >= self.relax_queue and required > 1:
+            required -= 1
+            reason = "load"
+
+        while True:
+            qualifying = [m for m in candidates if self.profiles[m]["quality"] >= required] or \
+                [max(candidates, key=lambda m: self.profiles[m]["quality"])]
+            estimates = {m: self.estimate_ms(m, tokens) for m in qualifying}
+            choice = min(qualifying, key=lambda m: (not is_ready(m), estimates[m]))
+            preferred = min(qualifying, key=lambda m: estimates[m])
+            if estimates[choice] <= self.slo_ms or required <= 1:
+                break
+            required -= 1
+            reason = "latency"
+
+        with self._lock:
+            self._decisions[choice][reason] = self._decisions[choice].get(reason, 0) + 1
+            self._recent.append({
+                "model": choice,
+                "reason": reason,
+                "detail_level": detail_level,
+                "tokens": tokens,
+                "estimated_ms": round(estimates[choice], 1),
+            })
+        return choice, reason, preferred
+
+    def begin(self, model_key: str):
+        with self._lock:
+            if model_key in self._inflight:
+                self._inflight[model_key] += 1
+
+    def end(self, model_key: str, seconds: Optional[float] = None, tokens: int = 0):
+        with self._lock:
+            if model_key not in self._inflight:
+                return
+            self._inflight[model_key] -= 1
+            if seconds is None or tokens <= 0:
+                return
+            observed = seconds * 1000 / (tokens / 1000)
+            previous = self._measured.get(model_key)
+            self._measured[model_key] = observed if previous is None else previous + self.smoothing * (observed - previous)
+            self._samples[model_key] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "slo_ms": self.slo_ms,
+                "relax_queue": self.relax_queue,
+                "models": {
+                    model_key: {
+                        "quality": profile["quality"],
+                        "family": profile["family"],
+                        "prior_ms_per_1k_tokens": profile["ms_per_1k_tokens"],
+                        "measured_ms_per_1k_tokens": round(self._measured[model_key], 1) if model_key in self._measured else None,
+                        "samples": self._samples[model_key],
+                        "inflight": self._inflight[model_key],
+                        "decisions": dict(self._decisions[model_key]),
+                    }
+                    for model_key, profile in self.profiles.items()
+                },
+                "recent": list(self._recent),
+            }
@@ -0,0 +1,123 @@
+import os
+
+
+def env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return int(value)
+
+
+def env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return float(value)
+
+
+def env_mapping(name: str) -> dict:
+    value = os.getenv(name, "")
+    mapping = {}
+    for item in value.split(","):
+        if "=" in item:
+            key, _, val = item.partition("=")
+            mapping[key.strip()] = val.strip()
+    return mapping
+
+
+def env_list(name: str, default: str) -> list:
+    value = os.getenv(name, default)
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def env_str(name: str, default: str) -> str:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip()
+
+
+BATCHING_ENABLED = env_bool("CONTENTSNAP_BATCHING", True)
+BATCH_MAX_SIZE = env_int("CONTENTSNAP_BATCH_MAX_SIZE", 8)
+BATCH_MAX_WAIT_MS = env_float("CONTENTSNAP_BATCH_MAX_WAIT_MS", 15.0)
+BATCH_WORKERS = env_int("CONTENTSNAP_BATCH_WORKERS", 1)
+
+INFERENCE_BACKEND = env_str("CONTENTSNAP_INFERENCE_BACKEND", "local")
+POOL_WORKERS = env_int("CONTENTSNAP_POOL_WORKERS", 0)
+POOL_CORES_PER_WORKER = env_int("CONTENTSNAP_POOL_CORES_PER_WORKER", 4)
+
+DATA_DIR = env_str("CONTENTSNAP_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+
+CACHE_ENABLED = env_bool("CONTENTSNAP_CACHE", True)
+CACHE_MEMORY_BYTES = env_int("CONTENTSNAP_CACHE_MEMORY_BYTES", 64 * 1024 * 1024)
+CACHE_DB_PATH = os.getenv("CONTENTSNAP_CACHE_DB", os.path.join(DATA_DIR, "summaries.sqlite3"))
+CACHE_TTL_SECONDS = env_float("CONTENTSNAP_CACHE_TTL_SECONDS", 7 * 24 * 3600.0)
+CACHE_MAX_DISK_ENTRIES = env_int("CONTENTSNAP_CACHE_MAX_DISK_ENTRIES", 100000)
+
+CHUNK_CACHE_ENABLED = env_bool("CONTENTSNAP_CHUNK_CACHE", True)
+CHUNK_CACHE_MEMORY_BYTES = env_int("CONTENTSNAP_CHUNK_CACHE_MEMORY_BYTES", 32 * 1024 * 1024)
+CHUNK_CACHE_DB_PATH = os.getenv("CONTENTSNAP_CHUNK_CACHE_DB", os.path.join(DATA_DIR, "chunks.sqlite3"))
+CHUNK_CACHE_MAX_DISK_ENTRIES = env_int("CONTENTSNAP_CHUNK_CACHE_MAX_DISK_ENTRIES", 500000)
+
+MODEL_BACKENDS = env_mapping("CONTENTSNAP_MODEL_BACKENDS")
+STUB_DELAY_MS = env_float("CONTENTSNAP_STUB_DELAY_MS", 0.0)
+ONNX_EXPORT_DIR = os.getenv("CONTENTSNAP_ONNX_DIR", os.path.join(DATA_DIR, "onnx"))
+
+PRELOAD_MODELS = env_list("CONTENTSNAP_PRELOAD_MODELS", "bart")
+
+TIMING_HEADER = env_bool("CONTENTSNAP_TIMING_HEADER", False)
+
+MAX_CONCURRENT_REQUESTS = env_int("CONTENTSNAP_MAX_CONCURRENT", 4)
+QUEUE_DEPTH = env_int("CONTENTSNAP_QUEUE_DEPTH", 16)
+MODEL_QUEUE_DEPTHS = {key: int(value) for key, value in env_mapping("CONTENTSNAP_MODEL_QUEUE_DEPTHS").items()}
+BACKGROUND_QUEUE_SHARE = env_float("CONTENTSNAP_BACKGROUND_QUEUE_SHARE", 0.5)
+DISCONNECT_POLL_MS = env_float("CONTENTSNAP_DISCONNECT_POLL_MS", 250.0)
+
+JOBS_ENABLED = env_bool("CONTENTSNAP_JOBS", True)
+JOBS_DB_PATH = os.getenv("CONTENTSNAP_JOBS_DB", os.path.join(DATA_DIR, "jobs.sqlite3"))
+JOBS_CONCURRENCY = env_int("CONTENTSNAP_JOBS_CONCURRENCY", 2)
+JOBS_MAX_DOCUMENTS = env_int("CONTENTSNAP_JOBS_MAX_DOCUMENTS", 10000)
+JOBS_RETENTION_SECONDS = env_float("CONTENTSNAP_JOBS_RETENTION_SECONDS", 7 * 24 * 3600.0)
+
+PREFILTER_ENABLED = env_bool("CONTENTSNAP_PREFILTER", True)
+PREFILTER_MIN_CHARS = env_int("CONTENTSNAP_PREFILTER_MIN_CHARS", 6000)
+PREFILTER_RATIOS = {
+    "low": 0.4,
+    "medium": 0.55,
+    "high": 0.75,
+    **{key: float(value) for key, value in env_mapping("CONTENTSNAP_PREFILTER_RATIOS").items()},
+}
+
+LATENCY_SLO_MS = env_float("CONTENTSNAP_LATENCY_SLO_MS", 10000.0)
+LATENCY_WINDOW_SECONDS = env_float("CONTENTSNAP_LATENCY_WINDOW_SECONDS", 120.0)
+AUTO_TIER_BALANCED_QUEUE = env_float("CONTENTSNAP_AUTO_TIER_BALANCED_QUEUE", 0.5)
+AUTO_TIER_FAST_QUEUE = env_float("CONTENTSNAP_AUTO_TIER_FAST_QUEUE", 1.5)
+
+BOILERPLATE_ENABLED = env_bool("CONTENTSNAP_BOILERPLATE", True)
+NEAR_DUPLICATE_SIMILARITY = env_float("CONTENTSNAP_NEAR_DUPLICATE_SIMILARITY", 0.8)
+SITE_REPEAT_THRESHOLD = env_int("CONTENTSNAP_SITE_REPEAT_THRESHOLD", 3)
+FINGERPRINT_DB_PATH = os.getenv("CONTENTSNAP_FINGERPRINT_DB", os.path.join(DATA_DIR, "fingerprints.sqlite3"))
+FINGERPRINT_MAX_ENTRIES = env_int("CONTENTSNAP_FINGERPRINT_MAX_ENTRIES", 1000000)
+
+HIERARCHICAL_ENABLED = env_bool("CONTENTSNAP_HIERARCHICAL", True)
+HIERARCHICAL_MIN_CHARS = env_int("CONTENTSNAP_HIERARCHICAL_MIN_CHARS", 50000)
+HIERARCHICAL_LEAF_CHARS = env_int("CONTENTSNAP_HIERARCHICAL_LEAF_CHARS", 3000)
+HIERARCHICAL_FAN_IN = env_int("CONTENTSNAP_HIERARCHICAL_FAN_IN", 4)
+HIERARCHICAL_WINDOW_CHARS = env_int("CONTENTSNAP_HIERARCHICAL_WINDOW_CHARS", 16384)
+UPLOAD_MAX_BYTES = env_int("CONTENTSNAP_UPLOAD_MAX_BYTES", 8 * 1024 * 1024)
+DECOMPRESSED_MAX_BYTES = env_int("CONTENTSNAP_DECOMPRESSED_MAX_BYTES", 16 * 1024 * 1024)
+
+SHARED_WEIGHTS = env_bool("CONTENTSNAP_SHARED_WEIGHTS", False)
+SHARED_WEIGHTS_DIR = os.getenv("CONTENTSNAP_SHARED_WEIGHTS_DIR", os.path.join(DATA_DIR, "shared_weights"))
+
+ROUTER_ENABLED = env_bool("CONTENTSNAP_ROUTER", False)
+ROUTER_MODELS = env_list("CONTENTSNAP_ROUTER_MODELS", "bart,distilbart,t5,t5_small")
+ROUTER_PROFILES_PATH = os.getenv("CONTENTSNAP_ROUTER_PROFILES", os.path.join(DATA_DIR, "model_profiles.json"))
+ROUTER_RELAX_QUEUE = env_float("CONTENTSNAP_ROUTER_RELAX_QUEUE", 1.0)
@@ -0,0 +1,115 @@
+import itertools
+import logging
+import os
+import re
+from typing import Dict, Optional
+
+import settings
+
+logger = logging.getLogger(__name__)
+
+MAPPING_HEADER = re.compile(r"^[0-9a-f]+-[0-9a-f]+\s")
+SMAPS_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty", "Swap")
+
+
+def weights_path(model_name: str) -> str:
+    return os.path.join(settings.SHARED_WEIGHTS_DIR, re.sub(r"[^\w.-]+", "_", model_name) + ".pt")
+
+
+def export_weights(model_name: str, path: str):
+    import torch
+    from transformers import AutoModelForSeq2SeqLM
+
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    torch.save(model.state_dict(), tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_mapped_model(model_name: str):
+    """Build ``model_name`` on top of a memory-mapped copy of its weights.
+
+    The first process to get here exports the state dict once, under a file lock. Every
+    process then maps the same file read-only, so the weight pages live in the page cache
+    once per node instead of once per worker.
+    """
+    import fcntl
+
+    import torch
+    from transformers import AutoConfig, AutoModelForSeq2SeqLM, GenerationConfig
+
+    path = weights_path(model_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f"{path}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if not os.path.exists(path):
+                logger.info(f"Exporting {model_name} weights to {path} for sharing across workers")
+                export_weights(model_name, path)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+    state_dict = torch.load(path, mmap=True, weights_only=True, map_location="cpu")
+    with torch.device("meta"):
+        model = AutoModelForSeq2SeqLM.from_config(AutoConfig.from_pretrained(model_name))
+    model.load_state_dict(state_dict, strict=False, assign=True)
+    model.tie_weights()
+    missing = [name for name, tensor in itertools.chain(model.named_parameters(), model.named_buffers()) if tensor.is_meta]
+    if missing:
+        raise RuntimeError(f"Shared weights for {model_name} are missing {len(missing)} tensors, e.g. {missing[:3]}")
+    try:
+        model.generation_config = GenerationConfig.from_pretrained(model_name)
+    except OSError:
+        pass
+    logger.info(f"Mapped shared weights for {model_name} from {path}")
+    return model.eval()
+
+
+def _read_smaps(pid: str, prefix: Optional[str] = None) -> Optional[Dict[str, dict]]:
+    """Sum smaps fields (in kB) for the whole process, and per file mapped under ``prefix``."""
+    try:
+        with open(f"/proc/{pid}/smaps") as smaps:
+            lines = smaps.readlines()
+    except OSError:
+        return None
+    totals = {"process": dict.fromkeys(SMAPS_FIELDS, 0)}
+    current = None
+    for line in lines:
+        if MAPPING_HEADER.match(line):
+            parts = line.split(None, 5)
+            path = parts[5].strip() if len(parts) > 5 else ""
+            current = None
+            if prefix and path.startswith(prefix):
+                current = totals.setdefault(os.path.basename(path), dict.fromkeys(SMAPS_FIELDS, 0))
+            continue
+        field, _, value = line.partition(":")
+        if field in SMAPS_FIELDS:
+            kb = int(value.split()[0])
+            totals["process"][field] += kb
+            if current is not None:
+                current[field] += kb
+    return totals
+
+
+def _summarize(fields: dict) -> dict:
+    return {
+        "rss_mb": round(fields["Rss"] / 1024, 1),
+        "pss_mb": round(fields["Pss"] / 1024, 1),
+        "shared_mb": round((fields["Shared_Clean"] + fields["Shared_Dirty"]) / 1024, 1),
+        "unique_mb": round((fields["Private_Clean"] + fields["Private_Dirty"]) / 1024, 1),
+        "swap_mb": round(fields["Swap"] / 1024, 1),
+    }
+
+
+def memory_report(pid: Optional[int] = None) -> dict:
+    """Unique versus shared resident memory of a process, with the shared weight files broken out."""
+    prefix = os.path.abspath(settings.SHARED_WEIGHTS_DIR) + os.sep
+    totals = _read_smaps(str(pid) if pid else "self", prefix)
+    if totals is None:
+        return {"pid": pid or os.getpid(), "available": False}
+    process = totals.pop("process")
+    return {
+        "pid": pid or os.getpid(),
+        **_summarize(process),
+        "weights": {name: _summarize(fields) for name, fields in totals.items()},
+    }
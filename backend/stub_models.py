@@ -0,0 +1,82 @@
+import re
+import threading
+import time
+import zlib
+from typing import Dict, List, Sequence
+
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+WORD = re.compile(r'\S+')
+
+
+class StubTokenizer:
+    """Whitespace tokenizer with the subset of the fast-tokenizer API the chunkers use."""
+
+    model_max_length = 1024
+    pad_token_id = 1
+    bos_token_id = 0
+    eos_token_id = 2
+
+    def __init__(self):
+        self._words: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def _word_id(self, word: str) -> int:
+        word_id = zlib.crc32(word.encode("utf-8")) % 1000000 + 10
+        if word_id not in self._words:
+            with self._lock:
+                self._words.setdefault(word_id, word)
+        return word_id
+
+    def __call__(self, text: str, add_special_tokens: bool = True, return_offsets_mapping: bool = False, **kwargs) -> dict:
+        offsets = [(m.start(), m.end()) for m in WORD.finditer(text)]
+        ids = [self._word_id(text[start:end]) for start, end in offsets]
+        if add_special_tokens:
+            ids = self.build_inputs_with_special_tokens(ids)
+        encoding = {"input_ids": ids}
+        if return_offsets_mapping:
+            encoding["offset_mapping"] = offsets
+        return encoding
+
+    def num_special_tokens_to_add(self, pair: bool = False) -> int:
+        return 2
+
+    def build_inputs_with_special_tokens(self, ids: List[int]) -> List[int]:
+        return [self.bos_token_id] + list(ids) + [self.eos_token_id]
+
+    def decode(self, ids: Sequence[int], skip_special_tokens: bool = True, **kwargs) -> str:
+        return " ".join(self._words[i] for i in ids if i in self._words)
+
+
+class StubSummarizer:
+    """Deterministic stand-in for a summarization pipeline, for benchmarking non-model overhead.
+
+    It returns the leading sentences of each input, capped at ``max_length`` words, after an
+    optional fixed delay per batch.
+    """
+
+    def __init__(self, delay_ms: float = 0.0):
+        self.tokenizer = StubTokenizer()
+        self.delay_ms = delay_ms
+
+    def _summarize(self, text: str, max_length: int, min_length: int) -> str:
+        words = []
+        for sentence in SENTENCE_END.split(text):
+            sentence_words = sentence.split()
+            if words and len(words) + len(sentence_words) > max_length:
+                break
+            words.extend(sentence_words)
+            if len(words) >= max(min_length, max_length // 2):
+                break
+        return " ".join(words[:max_length])
+
+    def run_batch(self, inputs: list, gen_kwargs: dict) -> List[str]:
+        if self.delay_ms:
+            time.sleep(self.delay_ms / 1000.0)
+        max_length = gen_kwargs.get("max_length", 130)
+        min_length = gen_kwargs.get("min_length", 30)
+        texts = [text if isinstance(text, str) else self.tokenizer.decode(text) for text in inputs]
+        return [self._summarize(text, max_length, min_length) for text in texts]
+
+    def __call__(self, inputs, batch_size: int = 1, **gen_kwargs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        return [{"summary_text": summary} for summary in self.run_batch(texts, gen_kwargs)]
@@ -142,8 +142,8 @@ class ContentSnapContent {
 
     cleanText(text) {
         return text
-            .replace(/\s+/g, ' ')
-            .replace(/\n\s*\n/g, '\n\n')
+            .replace(/[^\S\n]+/g, ' ')
+            .replace(/\s*\n\s*\n\s*/g, '\n\n')
             .trim();
     }
 
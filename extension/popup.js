@@ -200,7 +200,7 @@ class ContentSnapPopup {
                 return;
             }
 
-            await this.summarizeText(selectedText);
+            await this.summarizeText(selectedText, tab.url);
         } catch (error) {
             console.error('Error getting selected text:', error);
             if (error.message.includes('Cannot access this page')) {
@@ -229,23 +229,36 @@ class ContentSnapPopup {
         await this.summarizeText(text);
     }
 
-    async summarizeText(text) {
+    async summarizeText(text, sourceUrl = null) {
         this.showLoading();
         this.hideError();
 
         try {
-            const requestBody = {
-                text: text,
+            const options = {
                 format: this.formatSelect.value,
                 detail_level: this.detailSelect.value
             };
+            if (sourceUrl) {
+                options.source_url = sourceUrl;
+            }
 
+            const stored = await this.lookupSummary(text, options);
+            if (stored) {
+                this.showResult(stored.summary, text.length);
+                return;
+            }
+
+            const requestBody = { ...options, text: text, priority: 'interactive' };
             const response = await fetch(`${this.apiUrl}/summarize`, {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(requestBody)
+                ...(await this.encodeBody(JSON.stringify(requestBody)))
             });
 
+            if (response.status === 429) {
+                const retryAfter = response.headers.get('Retry-After') || 'a few';
+                throw new Error(`The summarization service is busy. Please try again in ${retryAfter} seconds.`);
+            }
+
             if (!response.ok) {
                 const errorData = await response.json().catch(() => ({}));
                 throw new Error(errorData.detail || `Server error: ${response.status}`);
@@ -266,6 +279,32 @@ class ContentSnapPopup {
         }
     }
 
+    async lookupSummary(text, options) {
+        try {
+            const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+            const contentHash = Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+            const response = await fetch(`${this.apiUrl}/summarize/lookup`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ ...options, content_hash: contentHash })
+            });
+            return response.ok ? await response.json() : null;
+        } catch (error) {
+            console.warn('Summary lookup failed, uploading text:', error);
+            return null;
+        }
+    }
+
+    async encodeBody(body) {
+        const headers = { 'Content-Type': 'application/json' };
+        if (body.length < 4096 || typeof CompressionStream === 'undefined') {
+            return { headers, body };
+        }
+        const stream = new Blob([body]).stream().pipeThrough(new CompressionStream('gzip'));
+        headers['Content-Encoding'] = 'gzip';
+        return { headers, body: await new Response(stream).arrayBuffer() };
+    }
+
     showResult(summary, originalLength) {
         this.resultContent.textContent = summary;
         const wordCount = summary.split(/\s+/).length;